@@ -2,32 +2,98 @@
 Compact Main GUI window for VAV system - optimized layout
 """
 
+from functools import partial
+import hashlib
+import threading
+import time
+import traceback
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QSlider, QGroupBox, QGridLayout,
-    QComboBox, QCheckBox, QTextEdit, QLineEdit, QMenu,
-    QSizePolicy,
+    QComboBox, QCheckBox, QPlainTextEdit, QLineEdit, QMenu,
+    QSizePolicy, QFileDialog, QApplication,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QLocale
+from PyQt6.QtGui import QImage, QPixmap, QDoubleValidator
 import numpy as np
 import cv2
+import sounddevice as sd
 
 from .device_dialog import DeviceSelectionDialog
 from .cv_meter_window import CVMeterWindow
+from ..vision.camera import get_camera_name
 from ..core.controller import VAVController
+from ..midi import MIDILearnManager
+
+# Grid cells keep fixed-size widgets packed left (as the old left-packed row layouts did)
+_CELL_ALIGN = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+# Cached sd.query_devices() result (host audio enumeration is slow)
+_DEVICE_CACHE = {"ts": 0.0, "devices": None}
+
+
+def _cached_query_devices(ttl: float = 5.0):
+    """Return sd.query_devices(), re-enumerating at most once per ttl seconds"""
+    now = time.monotonic()
+    if _DEVICE_CACHE["devices"] is None or now - _DEVICE_CACHE["ts"] >= ttl:
+        _DEVICE_CACHE["devices"] = sd.query_devices()
+        _DEVICE_CACHE["ts"] = now
+    return _DEVICE_CACHE["devices"]
+
+
+def _invalidate_device_cache():
+    """Force the next _cached_query_devices() call to re-enumerate"""
+    _DEVICE_CACHE["ts"] = 0.0
+    _DEVICE_CACHE["devices"] = None
 
 
 class CompactMainWindow(QMainWindow):
     """Compact main application window with efficient layout"""
 
     # Signals
-    frame_updated = pyqtSignal(np.ndarray)
-    cv_updated = pyqtSignal(np.ndarray)
+    frame_updated = pyqtSignal()  # latest frame is waiting in _latest_frame
+    cv_updated = pyqtSignal()  # latest CV values are waiting in _latest_cv
     visual_updated = pyqtSignal(dict)
     param_updated = pyqtSignal(str, int, float)  # param_name, channel, value
     midi_slider_updated = pyqtSignal(str, int)  # param_id, value - for thread-safe MIDI updates
     midi_button_updated = pyqtSignal(str, bool)  # param_id, state - for thread-safe MIDI button updates
+    midi_anchor_updated = pyqtSignal(str, float)  # axis ('x' or 'y'), value - MIDI anchor XY before the CV window exists
+    device_status_updated = pyqtSignal(int, str)  # request seq, status text - from device status worker
+
+    # Table-driven slider parameters: name -> (controller setter, keyword, divisor, label format)
+    # The controller receives value / divisor (raw value if divisor is None), as a queued
+    # keyword write or, if keyword is None, as a queued positional call. The label format
+    # gets the raw slider value as v and the scaled value as x (None: no value label)
+    _PARAM_TABLE = {
+        # Multiverse renderer
+        "color_scheme": ("set_color_scheme", None, 100.0, None),  # 0-100 → 0.0-1.0 continuous blend
+        "blend_mode": ("set_renderer_blend_mode", None, 100.0, None),  # 0-100 → 0.0-1.0 continuous blend
+        "brightness": ("set_renderer_brightness", None, 100.0, "{x:.1f}"),
+        "base_hue": ("set_renderer_base_hue", None, 333.0, "{v}"),  # 0-333 → 0.0-1.0
+        "camera_mix": ("set_renderer_camera_mix", None, 100.0, "{x:.2f}"),  # 0-30 → 0.0-0.3
+        # Alien4 / Ellen Ripley
+        "alien4_scan": ("set_alien4_scan", "value", 100.0, "{v}%"),
+        "alien4_mix": ("set_alien4_documenta_params", "mix", 100.0, "{x:.2f}"),
+        "alien4_fdbk": ("set_alien4_documenta_params", "feedback", 100.0, "{x:.2f}"),  # 0-80 → 0.0-0.8
+        "alien4_eq_low": ("set_alien4_documenta_params", "eq_low", 1.0, "{v}dB"),
+        "alien4_eq_mid": ("set_alien4_documenta_params", "eq_mid", 1.0, "{v}dB"),
+        "alien4_eq_high": ("set_alien4_documenta_params", "eq_high", 1.0, "{v}dB"),
+        "alien4_speed": ("set_alien4_documenta_params", "speed", 100.0, "{x:.2f}x"),
+        "alien4_poly": ("set_alien4_documenta_params", "poly", None, "{v}"),
+        "alien4_delay_time_l": ("set_alien4_delay_params", "time_l", 1000.0, "{x:.2f}s"),
+        "alien4_delay_time_r": ("set_alien4_delay_params", "time_r", 1000.0, "{x:.2f}s"),
+        "alien4_delay_fb": ("set_alien4_delay_params", "feedback", 100.0, "{v}%"),
+        "alien4_delay_wet": ("set_ellen_ripley_delay_params", "wet_dry", 100.0, "{v}%"),
+        "alien4_reverb_decay": ("set_alien4_reverb_params", "decay", 100.0, "{v}%"),
+        "alien4_reverb_wet": ("set_ellen_ripley_reverb_params", "wet_dry", 100.0, "{v}%"),
+        "chaos_rate": ("set_alien4_chaos_params", "rate", 100.0, "{v}%"),
+        "grain_wet": ("set_ellen_ripley_grain_params", "wet_dry", 100.0, "{v}%"),
+        # SD img2img
+        "sd_steps": ("set_sd_parameters", "num_steps", None, "{v}"),
+        "sd_strength": ("set_sd_parameters", "strength", 100.0, "{x:.2f}"),
+        "sd_guidance": ("set_sd_parameters", "guidance_scale", 10.0, "{x:.1f}"),  # 10-50 → 1.0-5.0
+    }
 
     def __init__(self, controller: VAVController):
         super().__init__()
@@ -36,26 +102,74 @@ class CompactMainWindow(QMainWindow):
         self.setGeometry(100, 100, 1300, 420)
 
         # Connect controller callbacks
+        # Latest-wins frame and CV slots: the vision thread overwrites _latest_frame /
+        # _latest_cv and only queues a GUI update when none is pending, so slow
+        # repaints drop stale values instead of backing up the event queue
+        self._latest_frame = None
+        self._paint_pending = False
+        self._last_frame_key = None  # (sampled pixel digest, display size) of the shown frame
+        self._display_buf = None  # Reused BGRX buffer for the video label (QImage Format_RGB32)
+        self._latest_cv = None
+        self._cv_pending = False
+        self._closing = False  # Set in closeEvent; worker-thread callbacks stop emitting
+        self._stop_thread = None  # controller.stop() worker, joined on aboutToQuit
+
         self.controller.set_frame_callback(self._on_frame)
         self.controller.set_cv_callback(self._on_cv)
         self.controller.set_visual_callback(self._on_visual)
         self.controller.set_param_callback(self._on_param)
 
         # Connect signals to slots (thread-safe)
-        self.frame_updated.connect(self._update_frame_display)
-        self.cv_updated.connect(self._update_cv_display)
-        self.visual_updated.connect(self._update_visual_display)
-        self.param_updated.connect(self._update_param_display)
-        self.midi_slider_updated.connect(self._on_midi_slider_update)
-        self.midi_button_updated.connect(self._on_midi_button_update)
+        # Emitted from the vision/audio/MIDI threads, so always queue explicitly
+        queued = Qt.ConnectionType.QueuedConnection
+        self.frame_updated.connect(self._paint_latest_frame, queued)
+        self.cv_updated.connect(self._show_latest_cv, queued)
+        self.visual_updated.connect(self._update_visual_display, queued)
+        self.param_updated.connect(self._update_param_display, queued)
+        self.midi_slider_updated.connect(self._on_midi_slider_update, queued)
+        self.midi_button_updated.connect(self._on_midi_button_update, queued)
+        self.midi_anchor_updated.connect(self._on_midi_anchor_update, queued)
+        self.device_status_updated.connect(self._on_device_status_ready, queued)
 
         # MIDI Learn system (initialize before building UI)
-        from ..midi import MIDILearnManager
         self.midi_learn = MIDILearnManager()
 
-        # Store MIDI slider and button callbacks for thread-safe updates
-        self._midi_slider_callbacks = {}
+        # Store MIDI sliders and button callbacks for thread-safe updates
+        self._midi_sliders = {}
         self._midi_button_callbacks = {}
+        self._midi_menu = None  # Shared MIDI Learn context menu, built on first right-click
+
+        # Precomputed value labels (indexed by slider value)
+        self._env_decay_lut = tuple(self._env_decay_time(v) for v in range(101))
+        self._env_decay_labels = [f"{decay:.2f}s" for decay in self._env_decay_lut]
+        self._scan_time_labels = [f"{v / 20.0:.1f}s" for v in range(6001)]
+        self._slice_length_labels = [self._slice_length_label(v / 100.0) for v in range(101)]
+        self._percent_labels = [f"{v}%" for v in range(121)]  # Range 1-120, Seq1 scan 0-100
+        self._tenth_labels = [f"{v / 100.0:.1f}" for v in range(101)]  # Mixer / curve sliders 0-100
+        self._hundredth_labels = [f"{v / 100.0:.2f}" for v in range(101)]  # LFO curve 0.00-1.00
+        self._angle_labels = [f"{v}°" for v in range(-180, 361)]  # Index v + 180: LFO -180..180, slider 0-360
+        self._param_labels = {}  # _PARAM_TABLE name -> (slider minimum, label strings)
+
+        # Coalesced controller writes: Alien4/Ellen Ripley params (setter name -> kwargs),
+        # renderer params (positional) and mixer track volumes, flushed at most once
+        # per frame while a slider is dragged
+        self._pending_params = {}
+        self._pending_calls = {}  # key -> (setter name, positional args)
+        self._mixer_pending = {}  # track -> volume (0.0-1.0)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_params)
+
+        # SD prompt and interval are sent once typing pauses (restarted on every keystroke)
+        self._sd_prompt_timer = QTimer(self)
+        self._sd_prompt_timer.setSingleShot(True)
+        self._sd_prompt_timer.setInterval(300)
+        self._sd_prompt_timer.timeout.connect(self._on_sd_prompt_changed)
+        self._sd_interval_timer = QTimer(self)
+        self._sd_interval_timer.setSingleShot(True)
+        self._sd_interval_timer.setInterval(300)
+        self._sd_interval_timer.timeout.connect(self._on_sd_interval_changed)
 
         # Build UI
         self._build_ui()
@@ -84,21 +198,18 @@ class CompactMainWindow(QMainWindow):
         # Initialize anchor position to center (50%, 50%)
         self.controller.set_anchor_position(50.0, 50.0)
 
-        # CV Meter Window (independent)
-        self.cv_meter_window = CVMeterWindow()
+        # CV Meter Window (independent) - created on Start, Video or the first CV update
+        self.cv_meter_window = None
 
-        # Set controller reference for CV Meter Window
-        self.cv_meter_window.set_controller(self.controller)
+        # Register Anchor XY with MIDI Learn now so saved mappings work before the window
+        # exists; its setup_midi_learn() takes these parameters over once it is created
+        self.midi_learn.register_parameter("anchor_x", partial(self.midi_anchor_updated.emit, "x"), 0.0, 100.0)
+        self.midi_learn.register_parameter("anchor_y", partial(self.midi_anchor_updated.emit, "y"), 0.0, 100.0)
 
         # 設定固定的 Chaos 和 Grain 參數 (內建值)
         self.controller.set_alien4_chaos_params(amount=1.0)  # Chaos Amount 固定 100%
         self.controller.set_alien4_grain_params(size=0.5, density=0.5)  # Grain Size/Density 固定 50%
 
-        # Setup MIDI Learn for Anchor XY in CV Meter Window
-        self.cv_meter_window.setup_midi_learn(self.midi_learn)
-
-        self.cv_meter_window.show()
-
         # Status bar
         self.status_label = QLabel("Ready")
         self.statusBar().addWidget(self.status_label)
@@ -109,58 +220,65 @@ class CompactMainWindow(QMainWindow):
         self.statusBar().addPermanentWidget(self.device_status_label)
 
         # Update initial device status
+        self._device_status_seq = 0
+        self._device_status_key = None  # Device snapshot of the pending/shown text
+        self._device_status_text = None  # Last built text for _device_status_key
         self._update_device_status()
 
-    def _make_slider_learnable(self, slider, param_id: str, callback):
-        """Make a slider MIDI-learnable with right-click context menu"""
-        from PyQt6.QtWidgets import QMenu
+    def _ensure_cv_meter_window(self) -> CVMeterWindow:
+        """Create and show the CV Meter Window on first use"""
+        if self.cv_meter_window is None:
+            self.cv_meter_window = CVMeterWindow()
 
-        # Enable context menu
-        slider.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+            # Set controller reference for CV Meter Window
+            self.cv_meter_window.set_controller(self.controller)
 
-        def show_context_menu(pos):
-            menu = QMenu()
-            learn_action = menu.addAction("MIDI Learn")
-            clear_action = menu.addAction("Clear MIDI Mapping")
-            menu.addSeparator()
-            clear_all_action = menu.addAction("Clear All MIDI Mappings")
+            # Setup MIDI Learn for Anchor XY in CV Meter Window
+            self.cv_meter_window.setup_midi_learn(self.midi_learn)
 
-            action = menu.exec(slider.mapToGlobal(pos))
+            # Sync the window's Range slider, label and ROI circle with the current range
+            range_slider, _ = self.range_slider
+            range_value = range_slider.value()
+            with QSignalBlocker(self.cv_meter_window.range_slider):
+                self.cv_meter_window.range_slider.setValue(range_value)
+            self.cv_meter_window.range_value_label.setText(self._percent_labels[range_value])
+            self.cv_meter_window.visual_preview.set_range(float(range_value))
 
-            if action == learn_action:
-                self.midi_learn.enter_learn_mode(param_id)
-            elif action == clear_action:
-                self.midi_learn.clear_mapping(param_id)
-            elif action == clear_all_action:
-                self.midi_learn.clear_all_mappings()
+            self.cv_meter_window.show()
+        return self.cv_meter_window
 
-        slider.customContextMenuRequested.connect(show_context_menu)
+    def _on_midi_anchor_update(self, axis: str, value: float):
+        """Forward a MIDI anchor XY update to the CV Meter Window (created on demand)"""
+        self._ensure_cv_meter_window().midi_anchor_updated.emit(axis, value)
+
+    def _make_slider_learnable(self, slider, param_id: str):
+        """Make a slider MIDI-learnable with right-click context menu"""
+        # Enable context menu
+        slider.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        slider.customContextMenuRequested.connect(partial(self._show_midi_menu, slider, param_id))
 
         # Register with MIDI Learn system
         min_val = slider.minimum()
         max_val = slider.maximum()
 
-        # Store slider and callback for thread-safe MIDI updates
-        self._midi_slider_callbacks[param_id] = (slider, callback)
-
-        def midi_callback(value):
-            # Value already scaled by midi_learn.py to slider range
-            slider_value = int(value)
-            # Emit signal to update GUI in main thread (thread-safe)
-            self.midi_slider_updated.emit(param_id, slider_value)
+        # Store slider for thread-safe MIDI updates (MIDI sets its value in the GUI thread)
+        self._midi_sliders[param_id] = slider
+        self.midi_learn.register_parameter(
+            param_id, partial(self._on_midi_slider_value, param_id), min_val, max_val
+        )
 
-        self.midi_learn.register_parameter(param_id, midi_callback, min_val, max_val)
+    def _on_midi_slider_value(self, param_id: str, value):
+        """MIDI Learn callback (MIDI thread); value already scaled to the slider range"""
+        # Emit signal to update GUI in main thread (thread-safe)
+        self.midi_slider_updated.emit(param_id, int(value))
 
     def _on_midi_slider_update(self, param_id: str, value: int):
         """Handle MIDI slider update in main thread (thread-safe)"""
-        if param_id in self._midi_slider_callbacks:
-            slider, callback = self._midi_slider_callbacks[param_id]
-            # Block signals to prevent recursion, then update slider
-            slider.blockSignals(True)
+        slider = self._midi_sliders.get(param_id)
+        if slider is not None:
+            # valueChanged (DirectConnection) runs the callback once; an
+            # unchanged value emits nothing, so there is nothing to redo
             slider.setValue(value)
-            slider.blockSignals(False)
-            # Call the original callback
-            callback(value)
 
     def _on_midi_button_update(self, param_id: str, state: bool):
         """Handle MIDI button update in main thread (thread-safe)"""
@@ -168,17 +286,19 @@ class CompactMainWindow(QMainWindow):
             callback = self._midi_button_callbacks[param_id]
             callback(state)
 
-    def _show_button_midi_menu(self, pos, button, param_id: str):
-        """Show MIDI context menu for button"""
-        from PyQt6.QtWidgets import QMenu
-
-        menu = QMenu()
-        learn_action = menu.addAction("MIDI Learn")
-        clear_action = menu.addAction("Clear MIDI Mapping")
-        menu.addSeparator()
-        clear_all_action = menu.addAction("Clear All MIDI Mappings")
+    def _show_midi_menu(self, widget, param_id: str, pos):
+        """Show MIDI Learn context menu for a slider or button"""
+        if self._midi_menu is None:
+            # Same three actions for every control; only param_id differs per call
+            menu = QMenu(self)
+            learn_action = menu.addAction("MIDI Learn")
+            clear_action = menu.addAction("Clear MIDI Mapping")
+            menu.addSeparator()
+            clear_all_action = menu.addAction("Clear All MIDI Mappings")
+            self._midi_menu = (menu, learn_action, clear_action, clear_all_action)
+        menu, learn_action, clear_action, clear_all_action = self._midi_menu
 
-        action = menu.exec(button.mapToGlobal(pos))
+        action = menu.exec(widget.mapToGlobal(pos))
 
         if action == learn_action:
             self.midi_learn.enter_learn_mode(param_id)
@@ -189,6 +309,9 @@ class CompactMainWindow(QMainWindow):
 
     def _build_ui(self):
         """Build compact UI layout"""
+        # Suppress repaints while the widget tree is assembled
+        self.setUpdatesEnabled(False)
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -245,81 +368,181 @@ class CompactMainWindow(QMainWindow):
         controls_layout.setSpacing(10)  # Horizontal spacing between columns
         controls_layout.setContentsMargins(5, 5, 5, 5)
         controls_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._slider_colors = []  # Column colors in use, see _apply_slider_style
         self._build_all_controls_inline(controls_layout)
 
         main_layout.addWidget(controls_widget)
 
-        # Video window (separate)
-        self.video_window = QWidget()
-        self.video_window.setWindowTitle("VAV - Video")
-        self.video_window.setStyleSheet("background-color: black;")
-        video_layout = QVBoxLayout(self.video_window)
-        video_layout.setContentsMargins(0, 0, 0, 0)
-        video_layout.setSpacing(0)
-        self.video_label = QLabel()
-        self.video_label.setMinimumSize(960, 540)
-        self.video_label.setStyleSheet("background-color: black;")
-        self.video_label.setScaledContents(True)
-        video_layout.addWidget(self.video_label)
+        # Video window (separate, created on first "Video" click)
+        self.video_window = None
+        self.video_label = None
+
+        # One window-level stylesheet for all sliders: parsed once instead of per slider
+        self.setStyleSheet(self._build_slider_qss(self._slider_colors))
+
+        self.setUpdatesEnabled(True)
+
+    def _ensure_video_window(self) -> QWidget:
+        """Create the separate video window on first use"""
+        if self.video_window is None:
+            self.video_window = QWidget()
+            self.video_window.setWindowTitle("VAV - Video")
+            self.video_window.setStyleSheet("background-color: black;")
+            video_layout = QVBoxLayout(self.video_window)
+            video_layout.setContentsMargins(0, 0, 0, 0)
+            video_layout.setSpacing(0)
+            self.video_label = QLabel()
+            self.video_label.setMinimumSize(960, 540)
+            self.video_label.setStyleSheet("background-color: black;")
+            # Frames are resized to the label in _update_frame_display; Ignored keeps the
+            # pixmap size from pinning the window's minimum size
+            self.video_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+            video_layout.addWidget(self.video_label)
+        return self.video_window
 
     def _fixed_height_label(self, text: str, width: int = None, align_left: bool = False) -> QLabel:
         """Create a QLabel with fixed height for consistent spacing"""
         label = QLabel(text)
-        label.setFixedHeight(16)
+        label.setTextFormat(Qt.TextFormat.PlainText)
         if width:
-            label.setFixedWidth(width)
+            label.setFixedSize(width, 16)
+        else:
+            label.setFixedHeight(16)
         if align_left:
             label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         return label
 
-    def _create_control_row(self, label_text: str, control_widget, value_label=None, label_width: int = 80):
-        """Create a horizontal row with label + control + optional value label"""
-        row = QHBoxLayout()
-        row.setSpacing(5)
-        row.setContentsMargins(0, 0, 0, 0)
+    @staticmethod
+    def _value_label(text: str, width: int) -> QLabel:
+        """Create a fixed-width plain-text value label (no rich-text or interaction handling)"""
+        label = QLabel(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        label.setFixedWidth(width)
+        return label
+
+    @staticmethod
+    def _new_column_grid() -> QGridLayout:
+        """Create a control column grid: label | control | value | stretch"""
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(5)
+        grid.setVerticalSpacing(8)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setColumnStretch(3, 1)
+        return grid
+
+    @staticmethod
+    def _next_grid_row(grid: QGridLayout) -> int:
+        """Index of the next free row (rowCount() is 1 for an empty grid)"""
+        return grid.rowCount() if grid.count() else 0
+
+    def _add_control_row(self, grid: QGridLayout, label_text: str, control_widget, value_label=None,
+                         label_width: int = 80):
+        """Append label + control + optional value label as the next row of a column grid"""
+        row = self._next_grid_row(grid)
 
         # Label (fixed width, left aligned)
         label = self._fixed_height_label(label_text, label_width, align_left=True)
-        row.addWidget(label)
+        grid.addWidget(label, row, 0, _CELL_ALIGN)
 
         # Control widget
-        row.addWidget(control_widget)
+        grid.addWidget(control_widget, row, 1, _CELL_ALIGN)
 
         # Optional value label
         if value_label:
-            row.addWidget(value_label)
+            grid.addWidget(value_label, row, 2, _CELL_ALIGN)
 
-        row.addStretch()
-        return row
+    @staticmethod
+    def _set_label_if_changed(label: QLabel, text: str):
+        """Set label text only when it differs (skips Qt relayout/repaint)"""
+        if label.text() != text:
+            label.setText(text)
 
     def _apply_slider_style(self, slider, color):
-        """Apply styled slider with MUJI-inspired pink color scheme"""
-        slider.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
+        """Apply styled slider with MUJI-inspired pink color scheme
+
+        Tags the slider with its column color; the rules live in the window
+        stylesheet installed by _build_ui (see _build_slider_qss)
+        """
+        slider.setProperty("sliderColor", color.lstrip("#"))
+        if color not in self._slider_colors:
+            self._slider_colors.append(color)
+
+    @staticmethod
+    def _build_slider_qss(colors) -> str:
+        """Build the window stylesheet for sliders tagged with each column color"""
+        rules = ["""
+            QSlider[sliderColor]::groove:horizontal {
                 background: #f0f0f0;
                 height: 4px;
                 border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
+            }
+        """]
+        for color in colors:
+            key = color.lstrip("#")
+            rules.append(f"""
+            QSlider[sliderColor="{key}"]::handle:horizontal {{
                 background: {color};
                 width: 12px;
                 height: 12px;
                 margin: -4px 0;
                 border-radius: 6px;
             }}
-            QSlider::handle:horizontal:hover {{
+            QSlider[sliderColor="{key}"]::handle:horizontal:hover {{
                 background: {color};
                 opacity: 0.8;
             }}
-            QSlider::sub-page:horizontal {{
+            QSlider[sliderColor="{key}"]::sub-page:horizontal {{
                 background: {color};
                 border-radius: 2px;
             }}
         """)
+        return "".join(rules)
+
+    def _make_std_slider(self, param_id: str, minimum: int, maximum: int, value: int,
+                         color: str, callback, width: int = 120) -> QSlider:
+        """Create a styled, MIDI-learnable horizontal slider wired to callback"""
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setFixedSize(width, 16)
+        self._apply_slider_style(slider, color)
+        slider.setRange(minimum, maximum)
+        slider.setValue(value)
+        # Sliders live on the GUI thread, skip the per-emit thread check
+        slider.valueChanged.connect(callback, Qt.ConnectionType.DirectConnection)
+        self._make_slider_learnable(slider, param_id)
+        return slider
+
+    def _add_slider_rows(self, grid: QGridLayout, color: str, label_width: int, specs):
+        """Add standard slider rows from (param_id, title, min, max, value, text, value_width, callback)
+
+        Stores each slider and value label as self.<param_id>_slider / self.<param_id>_label.
+        A callback of None routes the slider through _on_param_changed via _PARAM_TABLE.
+        """
+        for param_id, title, minimum, maximum, value, text, value_width, callback in specs:
+            if callback is None:
+                self._param_labels[param_id] = (minimum, self._build_param_labels(param_id, minimum, maximum))
+                callback = partial(self._on_param_changed, param_id)
+            slider = self._make_std_slider(param_id, minimum, maximum, value, color, callback)
+            label = self._value_label(text, value_width)
+            setattr(self, f"{param_id}_slider", slider)
+            setattr(self, f"{param_id}_label", label)
+            self._add_control_row(grid, title, slider, label, label_width)
+
+    def _apply_on_release(self, *names: str):
+        """Apply _PARAM_TABLE sliders on release instead of on every drag step
+
+        Tracking is turned off, so the controller write happens when the slider is
+        released (MIDI setValue still applies immediately); the value label is
+        previewed from sliderMoved while dragging.
+        """
+        for name in names:
+            slider = getattr(self, f"{name}_slider")
+            slider.setTracking(False)
+            slider.sliderMoved.connect(partial(self._preview_param_label, name),
+                                       Qt.ConnectionType.DirectConnection)
 
     def _build_all_controls_inline(self, hbox: QHBoxLayout):
-        """Build all controls in 5-column layout using VBoxLayout with _create_control_row helper"""
-        from PyQt6.QtWidgets import QVBoxLayout
+        """Build all controls in 5-column layout, one QGridLayout per column"""
 
         # Enhanced pink color scheme for better contrast
         COLOR_COL1 = "#FF6B9D"  # Vibrant pink (Audio basics)
@@ -327,21 +550,12 @@ class CompactMainWindow(QMainWindow):
         COLOR_COL3 = "#C77DFF"  # Purple (Multiverse channels)
         COLOR_COL4 = "#FF8FA3"  # Rose pink (Ellen Ripley)
 
-        # Create 5 independent VBox layouts with fixed label widths
-        col1_layout = QVBoxLayout()
-        col1_layout.setSpacing(8)
-
-        col2_layout = QVBoxLayout()
-        col2_layout.setSpacing(8)
-
-        col3_layout = QVBoxLayout()
-        col3_layout.setSpacing(8)
-
-        col4_layout = QVBoxLayout()
-        col4_layout.setSpacing(8)
-
-        col5_layout = QVBoxLayout()
-        col5_layout.setSpacing(8)
+        # Create 5 independent column grids (label | control | value) with fixed label widths
+        col1_layout = self._new_column_grid()
+        col2_layout = self._new_column_grid()
+        col3_layout = self._new_column_grid()
+        col4_layout = self._new_column_grid()
+        col5_layout = self._new_column_grid()
 
         # Fixed label width for consistent alignment
         LABEL_WIDTH = 80
@@ -349,73 +563,42 @@ class CompactMainWindow(QMainWindow):
         # ===== COLUMN 1: CV Source =====
 
         # ENV Decay (exponential: 0.01~1s, 1~5s)
-        self.env_global_slider = QSlider(Qt.Orientation.Horizontal)
-        self.env_global_slider.setFixedHeight(16)
-        self.env_global_slider.setFixedWidth(140)
-        self._apply_slider_style(self.env_global_slider, COLOR_COL1)
-        self.env_global_slider.setMinimum(0)
-        self.env_global_slider.setMaximum(100)
-        self.env_global_slider.setValue(0)
-        self.env_global_slider.valueChanged.connect(self._on_env_global_decay_changed)
-        self._make_slider_learnable(self.env_global_slider, "env_global_decay", self._on_env_global_decay_changed)
+        self.env_global_slider = self._make_std_slider(
+            "env_global_decay", 0, 100, 0, COLOR_COL1, self._on_env_global_decay_changed, width=140
+        )
         self.env_global_label = self._fixed_height_label("0.01s", 35)
-        row = self._create_control_row("ENV Decay", self.env_global_slider, self.env_global_label, LABEL_WIDTH)
-        col1_layout.addLayout(row)
+        self._add_control_row(col1_layout, "ENV Decay", self.env_global_slider, self.env_global_label, LABEL_WIDTH)
 
-        # Scan Time (掃描時間，秒)
-        slider = QSlider(Qt.Orientation.Horizontal)
-        slider.setFixedHeight(16)
-        slider.setFixedWidth(140)
-        self._apply_slider_style(slider, COLOR_COL1)
-        slider.setMinimum(2)  # 0.1s
-        slider.setMaximum(6000)  # 300s (5 minutes)
-        slider.setValue(200)  # 10.0s
-        slider.valueChanged.connect(self._on_clock_rate_changed)
-        self._make_slider_learnable(slider, "scan_time", self._on_clock_rate_changed)
+        # Scan Time (掃描時間，秒: 0.1s ~ 300s, default 10.0s)
+        slider = self._make_std_slider("scan_time", 2, 6000, 200, COLOR_COL1, self._on_clock_rate_changed, width=140)
         value = self._fixed_height_label("10.0s", 35)
         self.clock_slider = (slider, value)
-        row = self._create_control_row("Scan Time", slider, value, LABEL_WIDTH)
-        col1_layout.addLayout(row)
+        self._add_control_row(col1_layout, "Scan Time", slider, value, LABEL_WIDTH)
 
         # Range
-        slider = QSlider(Qt.Orientation.Horizontal)
-        slider.setFixedHeight(16)
-        slider.setFixedWidth(140)
-        self._apply_slider_style(slider, COLOR_COL1)
-        slider.setMinimum(1)
-        slider.setMaximum(120)
-        slider.setValue(50)
-        slider.valueChanged.connect(self._on_range_changed)
-        self._make_slider_learnable(slider, "range", self._on_range_changed)
+        slider = self._make_std_slider("range", 1, 120, 50, COLOR_COL1, self._on_range_changed, width=140)
         value = self._fixed_height_label("50%", 35)
         self.range_slider = (slider, value)
-        row = self._create_control_row("Range", slider, value, LABEL_WIDTH)
-        col1_layout.addLayout(row)
+        self._add_control_row(col1_layout, "Range", slider, value, LABEL_WIDTH)
 
         # Mixer (moved from COL2)
         self.mixer_sliders = []
         # Track 1-4
         for i in range(4):
-            mix_slider = QSlider(Qt.Orientation.Horizontal)
-            mix_slider.setFixedHeight(16)
-            mix_slider.setFixedWidth(140)
-            self._apply_slider_style(mix_slider, COLOR_COL1)
-            mix_slider.setMinimum(0)
-            mix_slider.setMaximum(100)
-            mix_slider.setValue(80)
-            mix_slider.valueChanged.connect(lambda val, idx=i: self._on_mixer_volume(idx, val / 100.0))
-            self._make_slider_learnable(mix_slider, f"track{i+1}_vol", lambda val, idx=i: self._on_mixer_volume(idx, val / 100.0))
+            mix_slider = self._make_std_slider(
+                f"track{i+1}_vol", 0, 100, 80, COLOR_COL1,
+                partial(self._on_mixer_volume, i), width=140
+            )
             mix_label = self._fixed_height_label("0.8", 25)
             self.mixer_sliders.append((mix_slider, mix_label))
-            row = self._create_control_row(f"Track {i+1} Vol", mix_slider, mix_label, LABEL_WIDTH)
-            col1_layout.addLayout(row)
+            self._add_control_row(col1_layout, f"Track {i+1} Vol", mix_slider, mix_label, LABEL_WIDTH)
 
         # CV Overlay checkbox
         self.cv_overlay_checkbox = QCheckBox("CV Overlay")
         self.cv_overlay_checkbox.setFixedHeight(16)
         self.cv_overlay_checkbox.setChecked(True)  # Default enabled
-        self.cv_overlay_checkbox.stateChanged.connect(self._on_cv_overlay_toggle)
-        col1_layout.addWidget(self.cv_overlay_checkbox)
+        self.cv_overlay_checkbox.toggled.connect(self._on_cv_overlay_toggle)
+        col1_layout.addWidget(self.cv_overlay_checkbox, self._next_grid_row(col1_layout), 0, 1, 3, _CELL_ALIGN)
 
         # Countdown Timer (倒數計時器)
         timer_layout = QHBoxLayout()
@@ -456,44 +639,18 @@ class CompactMainWindow(QMainWindow):
 
         timer_layout.addStretch()
 
-        # Timer row with label (manually create row since timer has complex layout)
-        timer_row = QHBoxLayout()
-        timer_row.setSpacing(5)
-        timer_row.setContentsMargins(0, 0, 0, 0)
+        # Timer row with label (timer layout spans the control and value cells)
+        row = self._next_grid_row(col1_layout)
         timer_label = self._fixed_height_label("Timer", LABEL_WIDTH, align_left=True)
-        timer_row.addWidget(timer_label)
-        timer_row.addLayout(timer_layout)
-        col1_layout.addLayout(timer_row)
-
-        # Scene Change Threshold (1-10%)
-        self.scene_threshold_slider = QSlider(Qt.Orientation.Horizontal)
-        self.scene_threshold_slider.setFixedHeight(16)
-        self.scene_threshold_slider.setFixedWidth(120)
-        self._apply_slider_style(self.scene_threshold_slider, COLOR_COL1)
-        self.scene_threshold_slider.setMinimum(1)
-        self.scene_threshold_slider.setMaximum(10)
-        self.scene_threshold_slider.setValue(1)
-        self.scene_threshold_slider.valueChanged.connect(self._on_scene_threshold_changed)
-        self._make_slider_learnable(self.scene_threshold_slider, "scene_threshold", self._on_scene_threshold_changed)
-        self.scene_threshold_label = QLabel("1%")
-        self.scene_threshold_label.setFixedWidth(30)
-        row = self._create_control_row("Scene", self.scene_threshold_slider, self.scene_threshold_label, LABEL_WIDTH)
-        col1_layout.addLayout(row)
-
-        # Chaos Ratio (LFO speed relative to scan time: 0.1-1.0)
-        self.chaos_ratio_slider = QSlider(Qt.Orientation.Horizontal)
-        self.chaos_ratio_slider.setFixedHeight(16)
-        self.chaos_ratio_slider.setFixedWidth(120)
-        self._apply_slider_style(self.chaos_ratio_slider, COLOR_COL1)
-        self.chaos_ratio_slider.setMinimum(10)  # 0.1
-        self.chaos_ratio_slider.setMaximum(100)  # 1.0
-        self.chaos_ratio_slider.setValue(10)  # 0.1 default (1/10 speed)
-        self.chaos_ratio_slider.valueChanged.connect(self._on_chaos_ratio_changed)
-        self._make_slider_learnable(self.chaos_ratio_slider, "chaos_ratio", self._on_chaos_ratio_changed)
-        self.chaos_ratio_label = QLabel("1/10")
-        self.chaos_ratio_label.setFixedWidth(30)
-        row = self._create_control_row("Chaos", self.chaos_ratio_slider, self.chaos_ratio_label, LABEL_WIDTH)
-        col1_layout.addLayout(row)
+        col1_layout.addWidget(timer_label, row, 0, _CELL_ALIGN)
+        col1_layout.addLayout(timer_layout, row, 1, 1, 2)
+
+        self._add_slider_rows(col1_layout, COLOR_COL1, LABEL_WIDTH, [
+            # Scene Change Threshold (1-10%)
+            ("scene_threshold", "Scene", 1, 10, 1, "1%", 30, self._on_scene_threshold_changed),
+            # Chaos Ratio (LFO speed relative to scan time: 0.1-1.0, default 1/10 speed)
+            ("chaos_ratio", "Chaos", 10, 100, 10, "1/10", 30, self._on_chaos_ratio_changed),
+        ])
 
         # Timer state variables (initialized after layout creation)
         self.timer_running = False
@@ -509,10 +666,10 @@ class CompactMainWindow(QMainWindow):
         self.timer_target_blend_mode = 100
         self.timer_target_base_hue = 333
 
-        # Timer update (using QTimer)
+        # Timer update (single-shot QTimer, rescheduled for the next visible change)
         self.timer_updater = QTimer()
+        self.timer_updater.setSingleShot(True)
         self.timer_updater.timeout.connect(self._update_timer)
-        self.timer_updater.setInterval(100)  # Update every 100ms
 
         # ===== COLUMN 2: Multiverse Main =====
 
@@ -520,94 +677,34 @@ class CompactMainWindow(QMainWindow):
         self.multiverse_checkbox = QCheckBox("Multiverse")
         self.multiverse_checkbox.setFixedHeight(16)  # Match slider height for consistent spacing
         self.multiverse_checkbox.setChecked(True)  # Default enabled
-        self.multiverse_checkbox.stateChanged.connect(self._on_multiverse_toggle)
-
-        # Color scheme fader (no label, continuous blend)
-        self.color_scheme_slider = QSlider(Qt.Orientation.Horizontal)
-        self.color_scheme_slider.setFixedHeight(16)
-        self.color_scheme_slider.setFixedWidth(120)
-        self._apply_slider_style(self.color_scheme_slider, COLOR_COL2)
-        self.color_scheme_slider.setMinimum(0)
-        self.color_scheme_slider.setMaximum(100)
-        self.color_scheme_slider.setValue(50)  # Default to middle (Tri+Contrast)
-        self.color_scheme_slider.valueChanged.connect(self._on_color_scheme_changed)
-        self._make_slider_learnable(self.color_scheme_slider, "color_scheme", self._on_color_scheme_changed)
+        self.multiverse_checkbox.toggled.connect(self._on_multiverse_toggle)
+
+        # Color scheme fader (no label, continuous blend; default middle = Tri+Contrast)
+        self.color_scheme_slider = self._make_std_slider(
+            "color_scheme", 0, 100, 50, COLOR_COL2, partial(self._on_param_changed, "color_scheme")
+        )
 
         # Multiverse row - put checkbox in place of label, slider aligned
-        multiverse_row_layout = QHBoxLayout()
-        multiverse_row_layout.setSpacing(5)
-        multiverse_row_layout.setContentsMargins(0, 0, 0, 0)
+        row = self._next_grid_row(col2_layout)
 
         # Checkbox acts as the label (fixed width to match label width)
         self.multiverse_checkbox.setFixedWidth(LABEL_WIDTH)
-        multiverse_row_layout.addWidget(self.multiverse_checkbox)
-
-        # Add 9px spacing to push slider right
-        multiverse_row_layout.addSpacing(9)
-
-        # Slider (same position as other sliders)
-        multiverse_row_layout.addWidget(self.color_scheme_slider)
-        multiverse_row_layout.addStretch()
-
-        col2_layout.addLayout(multiverse_row_layout)
-
-        # Blend mode fader
-        self.blend_mode_slider = QSlider(Qt.Orientation.Horizontal)
-        self.blend_mode_slider.setFixedHeight(16)
-        self.blend_mode_slider.setFixedWidth(120)
-        self._apply_slider_style(self.blend_mode_slider, COLOR_COL2)
-        self.blend_mode_slider.setMinimum(0)
-        self.blend_mode_slider.setMaximum(100)
-        self.blend_mode_slider.setValue(0)  # Default to Add
-        self.blend_mode_slider.valueChanged.connect(self._on_blend_mode_changed)
-        self._make_slider_learnable(self.blend_mode_slider, "blend_mode", self._on_blend_mode_changed)
-        row = self._create_control_row("Blend", self.blend_mode_slider, None, LABEL_WIDTH)
-        col2_layout.addLayout(row)
-
-        # Brightness
-        self.brightness_slider = QSlider(Qt.Orientation.Horizontal)
-        self.brightness_slider.setFixedHeight(16)
-        self.brightness_slider.setFixedWidth(120)
-        self._apply_slider_style(self.brightness_slider, COLOR_COL2)
-        self.brightness_slider.setMinimum(0)
-        self.brightness_slider.setMaximum(400)
-        self.brightness_slider.setValue(150)  # Default 1.5
-        self.brightness_slider.valueChanged.connect(self._on_brightness_changed)
-        self._make_slider_learnable(self.brightness_slider, "brightness", self._on_brightness_changed)
-        self.brightness_label = QLabel("1.5")
-        self.brightness_label.setFixedWidth(25)
-        row = self._create_control_row("Brightness", self.brightness_slider, self.brightness_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
-
-        # Base Hue
-        self.base_hue_slider = QSlider(Qt.Orientation.Horizontal)
-        self.base_hue_slider.setFixedHeight(16)
-        self.base_hue_slider.setFixedWidth(120)
-        self._apply_slider_style(self.base_hue_slider, COLOR_COL2)
-        self.base_hue_slider.setMinimum(0)
-        self.base_hue_slider.setMaximum(333)
-        self.base_hue_slider.setValue(0)  # Default red
-        self.base_hue_slider.valueChanged.connect(self._on_base_hue_changed)
-        self._make_slider_learnable(self.base_hue_slider, "base_hue", self._on_base_hue_changed)
-        self.base_hue_label = QLabel("0")
-        self.base_hue_label.setFixedWidth(25)
-        row = self._create_control_row("Base Hue", self.base_hue_slider, self.base_hue_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
-
-        # Camera Mix
-        self.camera_mix_slider = QSlider(Qt.Orientation.Horizontal)
-        self.camera_mix_slider.setFixedHeight(16)
-        self.camera_mix_slider.setFixedWidth(120)
-        self._apply_slider_style(self.camera_mix_slider, COLOR_COL2)
-        self.camera_mix_slider.setMinimum(0)
-        self.camera_mix_slider.setMaximum(30)  # Max 0.3
-        self.camera_mix_slider.setValue(0)  # Default: pure multiverse
-        self.camera_mix_slider.valueChanged.connect(self._on_camera_mix_changed)
-        self._make_slider_learnable(self.camera_mix_slider, "camera_mix", self._on_camera_mix_changed)
-        self.camera_mix_label = QLabel("0.0")
-        self.camera_mix_label.setFixedWidth(25)
-        row = self._create_control_row("Camera Mix", self.camera_mix_slider, self.camera_mix_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
+        col2_layout.addWidget(self.multiverse_checkbox, row, 0, _CELL_ALIGN)
+
+        # Slider (same grid column as other sliders)
+        col2_layout.addWidget(self.color_scheme_slider, row, 1, _CELL_ALIGN)
+
+        # Blend mode fader (default Add)
+        self.blend_mode_slider = self._make_std_slider(
+            "blend_mode", 0, 100, 0, COLOR_COL2, partial(self._on_param_changed, "blend_mode")
+        )
+        self._add_control_row(col2_layout, "Blend", self.blend_mode_slider, None, LABEL_WIDTH)
+
+        self._add_slider_rows(col2_layout, COLOR_COL2, LABEL_WIDTH, [
+            ("brightness", "Brightness", 0, 400, 150, "1.5", 25, None),  # Default 1.5
+            ("base_hue", "Base Hue", 0, 333, 0, "0", 25, None),  # Default red
+            ("camera_mix", "Camera Mix", 0, 30, 0, "0.0", 25, None),  # Max 0.3, default pure multiverse
+        ])
 
         # Compress fixed at 2.0 in shader
 
@@ -619,79 +716,47 @@ class CompactMainWindow(QMainWindow):
         self.region_rendering_checkbox = QCheckBox("Region Map")
         self.region_rendering_checkbox.setFixedHeight(16)  # Match slider height for consistent spacing
         self.region_rendering_checkbox.setChecked(True)  # Default enabled
-        self.region_rendering_checkbox.stateChanged.connect(self._on_region_rendering_toggle)
+        self.region_rendering_checkbox.toggled.connect(self._on_region_rendering_toggle)
         region_sd_layout.addWidget(self.region_rendering_checkbox)
 
         self.sd_checkbox = QCheckBox("SD img2img")
         self.sd_checkbox.setFixedHeight(16)  # Match slider height for consistent spacing
         self.sd_checkbox.setChecked(False)
-        self.sd_checkbox.stateChanged.connect(self._on_sd_toggle)
+        self.sd_checkbox.toggled.connect(self._on_sd_toggle)
         region_sd_layout.addWidget(self.sd_checkbox)
         region_sd_layout.addStretch()
 
-        col2_layout.addLayout(region_sd_layout)
+        col2_layout.addLayout(region_sd_layout, self._next_grid_row(col2_layout), 0, 1, 3)
 
         # SD Prompt (multiline text area, no label)
-        self.sd_prompt_edit = QTextEdit()
+        self.sd_prompt_edit = QPlainTextEdit()  # Plain document: no rich-text layout per keystroke
         self.sd_prompt_edit.setFixedHeight(40)
+        self.sd_prompt_edit.setTabChangesFocus(True)
         self.sd_prompt_edit.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.sd_prompt_edit.setPlainText("artistic style, abstract, monochrome ink painting, high quality")
-        self.sd_prompt_edit.textChanged.connect(self._on_sd_prompt_changed)
-        col2_layout.addWidget(self.sd_prompt_edit)
-
-        # SD Steps
-        self.sd_steps_slider = QSlider(Qt.Orientation.Horizontal)
-        self.sd_steps_slider.setFixedHeight(16)
-        self.sd_steps_slider.setFixedWidth(120)
-        self._apply_slider_style(self.sd_steps_slider, COLOR_COL2)
-        self.sd_steps_slider.setMinimum(1)
-        self.sd_steps_slider.setMaximum(4)  # 最高到 4
-        self.sd_steps_slider.setValue(2)
-        self.sd_steps_slider.valueChanged.connect(self._on_sd_steps_changed)
-        self._make_slider_learnable(self.sd_steps_slider, "sd_steps", self._on_sd_steps_changed)
-        self.sd_steps_label = QLabel("2")
-        self.sd_steps_label.setFixedWidth(25)
-        row = self._create_control_row("Steps", self.sd_steps_slider, self.sd_steps_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
-
-        # SD Strength
-        self.sd_strength_slider = QSlider(Qt.Orientation.Horizontal)
-        self.sd_strength_slider.setFixedHeight(16)
-        self.sd_strength_slider.setFixedWidth(120)
-        self._apply_slider_style(self.sd_strength_slider, COLOR_COL2)
-        self.sd_strength_slider.setMinimum(50)
-        self.sd_strength_slider.setMaximum(100)
-        self.sd_strength_slider.setValue(50)
-        self.sd_strength_slider.valueChanged.connect(self._on_sd_strength_changed)
-        self._make_slider_learnable(self.sd_strength_slider, "sd_strength", self._on_sd_strength_changed)
-        self.sd_strength_label = QLabel("0.50")
-        self.sd_strength_label.setFixedWidth(30)
-        row = self._create_control_row("Strength", self.sd_strength_slider, self.sd_strength_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
-
-        # SD Guidance
-        self.sd_guidance_slider = QSlider(Qt.Orientation.Horizontal)
-        self.sd_guidance_slider.setFixedHeight(16)
-        self.sd_guidance_slider.setFixedWidth(120)
-        self._apply_slider_style(self.sd_guidance_slider, COLOR_COL2)
-        self.sd_guidance_slider.setMinimum(10)
-        self.sd_guidance_slider.setMaximum(50)  # 最高到 5.0
-        self.sd_guidance_slider.setValue(10)
-        self.sd_guidance_slider.valueChanged.connect(self._on_sd_guidance_changed)
-        self._make_slider_learnable(self.sd_guidance_slider, "sd_guidance", self._on_sd_guidance_changed)
-        self.sd_guidance_label = QLabel("1.0")
-        self.sd_guidance_label.setFixedWidth(30)
-        row = self._create_control_row("Guidance", self.sd_guidance_slider, self.sd_guidance_label, LABEL_WIDTH)
-        col2_layout.addLayout(row)
+        self.sd_prompt_edit.textChanged.connect(self._sd_prompt_timer.start)
+        col2_layout.addWidget(self.sd_prompt_edit, self._next_grid_row(col2_layout), 0, 1, 3, _CELL_ALIGN)
+
+        self._add_slider_rows(col2_layout, COLOR_COL2, LABEL_WIDTH, [
+            ("sd_steps", "Steps", 1, 4, 2, "2", 25, None),  # 最高到 4
+            ("sd_strength", "Strength", 50, 100, 50, "0.50", 30, None),
+            ("sd_guidance", "Guidance", 10, 50, 10, "1.0", 30, None),  # 最高到 5.0
+        ])
+        # SD parameters go to the img2img worker: apply once on release
+        self._apply_on_release("sd_steps", "sd_strength", "sd_guidance")
 
         # SD Gen Interval
         self.sd_interval_edit = QLineEdit("0.5")
         self.sd_interval_edit.setFixedWidth(120)
         self.sd_interval_edit.setFixedHeight(16)  # Match slider height for consistent spacing
-        self.sd_interval_edit.textChanged.connect(self._on_sd_interval_changed)
+        # Only seconds in 0.01-60 with up to 2 decimals; C locale so "." matches float()
+        interval_validator = QDoubleValidator(0.01, 60.0, 2, self.sd_interval_edit)
+        interval_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        interval_validator.setLocale(QLocale.c())
+        self.sd_interval_edit.setValidator(interval_validator)
+        self.sd_interval_edit.textChanged.connect(self._sd_interval_timer.start)
         interval_suffix = QLabel("s")
-        row = self._create_control_row("Gen Interval", self.sd_interval_edit, interval_suffix, LABEL_WIDTH)
-        col2_layout.addLayout(row)
+        self._add_control_row(col2_layout, "Gen Interval", self.sd_interval_edit, interval_suffix, LABEL_WIDTH)
 
         # ===== COLUMN 3: Multiverse Channels (Ch1-4, vertical layout) =====
         self.channel_curve_sliders = []
@@ -700,45 +765,27 @@ class CompactMainWindow(QMainWindow):
 
         # Create all 4 channels with vertical layout (Curve, Angle in separate rows)
         for i in range(4):
-            # Curve (現在是 modulation amount 0-100%)
-            curve_slider = QSlider(Qt.Orientation.Horizontal)
-            curve_slider.setFixedHeight(16)
-            curve_slider.setFixedWidth(120)
-            self._apply_slider_style(curve_slider, COLOR_COL3)
-            curve_slider.setMinimum(0)
-            curve_slider.setMaximum(100)
-            curve_slider.setValue(100)  # 預設 100% modulation
-            curve_slider.valueChanged.connect(lambda val, idx=i: self._on_channel_curve_changed(idx, val))
-            self._make_slider_learnable(curve_slider, f"ch{i+1}_curve", lambda val, idx=i: self._on_channel_curve_changed(idx, val))
-            curve_label = QLabel("0.0")
-            curve_label.setFixedWidth(25)
+            # Curve (現在是 modulation amount 0-100%, 預設 100%)
+            curve_slider = self._make_std_slider(
+                f"ch{i+1}_curve", 0, 100, 100, COLOR_COL3,
+                partial(self._on_channel_curve_changed, i)
+            )
+            curve_label = self._value_label("0.0", 25)
             self.channel_curve_sliders.append((curve_slider, curve_label))
-            row = self._create_control_row(f"Ch{i+1} Curve", curve_slider, curve_label, LABEL_WIDTH)
-            col3_layout.addLayout(row)
-
-            # Angle (現在是 modulation amount 0-360 映射到 0-100%)
-            angle_slider = QSlider(Qt.Orientation.Horizontal)
-            angle_slider.setFixedHeight(16)
-            angle_slider.setFixedWidth(120)
-            self._apply_slider_style(angle_slider, COLOR_COL3)
-            angle_slider.setMinimum(0)
-            angle_slider.setMaximum(360)
-            angle_slider.setValue(360)  # 預設 360 = 100% modulation
-            angle_slider.valueChanged.connect(lambda val, idx=i: self._on_channel_angle_changed(idx, val))
-            self._make_slider_learnable(angle_slider, f"ch{i+1}_angle", lambda val, idx=i: self._on_channel_angle_changed(idx, val))
-            angle_label = QLabel(f"{default_angles[i]}°")
-            angle_label.setFixedWidth(30)
+            self._add_control_row(col3_layout, f"Ch{i+1} Curve", curve_slider, curve_label, LABEL_WIDTH)
+
+            # Angle (現在是 modulation amount 0-360 映射到 0-100%, 預設 360 = 100%)
+            angle_slider = self._make_std_slider(
+                f"ch{i+1}_angle", 0, 360, 360, COLOR_COL3,
+                partial(self._on_channel_angle_changed, i)
+            )
+            angle_label = self._value_label(f"{default_angles[i]}°", 30)
             self.channel_angle_sliders.append((angle_slider, angle_label))
-            row = self._create_control_row(f"Ch{i+1} Angle", angle_slider, angle_label, LABEL_WIDTH)
-            col3_layout.addLayout(row)
+            self._add_control_row(col3_layout, f"Ch{i+1} Angle", angle_slider, angle_label, LABEL_WIDTH)
 
         # ===== COLUMN 4: Alien4 Loop+EQ =====
 
         # REC (Recording button - similar to Timer Start button)
-        rec_row_layout = QHBoxLayout()
-        rec_row_layout.setSpacing(5)
-        rec_row_layout.setContentsMargins(0, 0, 0, 0)
-
         self.alien4_rec_button = QPushButton("REC")
         self.alien4_rec_button.setFixedWidth(50)
         self.alien4_rec_button.setFixedHeight(24)
@@ -746,262 +793,47 @@ class CompactMainWindow(QMainWindow):
         self.alien4_rec_button.clicked.connect(self._on_alien4_rec_toggle)
         self.alien4_rec_button.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.alien4_rec_button.customContextMenuRequested.connect(
-            lambda pos: self._show_button_midi_menu(pos, self.alien4_rec_button, "alien4_rec")
+            partial(self._show_midi_menu, self.alien4_rec_button, "alien4_rec")
         )
-        rec_row_layout.addWidget(self.alien4_rec_button)
-        rec_row_layout.addStretch()
-
-        rec_row = QHBoxLayout()
-        rec_row.setSpacing(5)
-        rec_row.setContentsMargins(0, 0, 0, 0)
-        rec_label = self._fixed_height_label("REC", LABEL_WIDTH, align_left=True)
-        rec_row.addWidget(rec_label)
-        rec_row.addLayout(rec_row_layout)
-        col4_layout.addLayout(rec_row)
-
-        # SCAN (Slice scan, 0-100%)
-        self.alien4_scan_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_scan_slider.setFixedHeight(16)
-        self.alien4_scan_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_scan_slider, COLOR_COL4)
-        self.alien4_scan_slider.setMinimum(0)
-        self.alien4_scan_slider.setMaximum(100)
-        self.alien4_scan_slider.setValue(0)
-        self.alien4_scan_slider.valueChanged.connect(self._on_alien4_scan_changed)
-        self._make_slider_learnable(self.alien4_scan_slider, "alien4_scan", self._on_alien4_scan_changed)
-        self.alien4_scan_label = QLabel("0%")
-        self.alien4_scan_label.setFixedWidth(30)
-        row = self._create_control_row("SCAN", self.alien4_scan_slider, self.alien4_scan_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # LENGTH (Slice length, 0.05-5.0s)
-        self.alien4_length_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_length_slider.setFixedHeight(16)
-        self.alien4_length_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_length_slider, COLOR_COL4)
-        self.alien4_length_slider.setMinimum(0)
-        self.alien4_length_slider.setMaximum(100)
-        self.alien4_length_slider.setValue(50)  # Default to 0.5 → ~0.5s slice length
-        self.alien4_length_slider.valueChanged.connect(self._on_alien4_length_changed)
-        self._make_slider_learnable(self.alien4_length_slider, "alien4_length", self._on_alien4_length_changed)
-        self.alien4_length_label = QLabel("0.50s")
-        self.alien4_length_label.setFixedWidth(35)
-        row = self._create_control_row("LEN", self.alien4_length_slider, self.alien4_length_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # MIX (Input/Loop mix, 0-100%)
-        self.alien4_mix_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_mix_slider.setFixedHeight(16)
-        self.alien4_mix_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_mix_slider, COLOR_COL4)
-        self.alien4_mix_slider.setMinimum(0)
-        self.alien4_mix_slider.setMaximum(100)
-        self.alien4_mix_slider.setValue(0)
-        self.alien4_mix_slider.valueChanged.connect(self._on_alien4_mix_changed)
-        self._make_slider_learnable(self.alien4_mix_slider, "alien4_mix", self._on_alien4_mix_changed)
-        self.alien4_mix_label = QLabel("0.00")
-        self.alien4_mix_label.setFixedWidth(30)
-        row = self._create_control_row("MIX", self.alien4_mix_slider, self.alien4_mix_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # FDBK (Feedback, 0-80%)
-        self.alien4_fdbk_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_fdbk_slider.setFixedHeight(16)
-        self.alien4_fdbk_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_fdbk_slider, COLOR_COL4)
-        self.alien4_fdbk_slider.setMinimum(0)
-        self.alien4_fdbk_slider.setMaximum(80)
-        self.alien4_fdbk_slider.setValue(0)
-        self.alien4_fdbk_slider.valueChanged.connect(self._on_alien4_fdbk_changed)
-        self._make_slider_learnable(self.alien4_fdbk_slider, "alien4_fdbk", self._on_alien4_fdbk_changed)
-        self.alien4_fdbk_label = QLabel("0.00")
-        self.alien4_fdbk_label.setFixedWidth(30)
-        row = self._create_control_row("FDBK", self.alien4_fdbk_slider, self.alien4_fdbk_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # EQ Low (0 to -20 dB, cut only)
-        self.alien4_eq_low_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_eq_low_slider.setFixedHeight(16)
-        self.alien4_eq_low_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_eq_low_slider, COLOR_COL4)
-        self.alien4_eq_low_slider.setMinimum(-20)
-        self.alien4_eq_low_slider.setMaximum(0)
-        self.alien4_eq_low_slider.setValue(0)
-        self.alien4_eq_low_slider.valueChanged.connect(self._on_alien4_eq_low_changed)
-        self._make_slider_learnable(self.alien4_eq_low_slider, "alien4_eq_low", self._on_alien4_eq_low_changed)
-        self.alien4_eq_low_label = QLabel("0dB")
-        self.alien4_eq_low_label.setFixedWidth(35)
-        row = self._create_control_row("EQ Low", self.alien4_eq_low_slider, self.alien4_eq_low_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # EQ Mid (0 to -20 dB, cut only)
-        self.alien4_eq_mid_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_eq_mid_slider.setFixedHeight(16)
-        self.alien4_eq_mid_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_eq_mid_slider, COLOR_COL4)
-        self.alien4_eq_mid_slider.setMinimum(-20)
-        self.alien4_eq_mid_slider.setMaximum(0)
-        self.alien4_eq_mid_slider.setValue(0)
-        self.alien4_eq_mid_slider.valueChanged.connect(self._on_alien4_eq_mid_changed)
-        self._make_slider_learnable(self.alien4_eq_mid_slider, "alien4_eq_mid", self._on_alien4_eq_mid_changed)
-        self.alien4_eq_mid_label = QLabel("0dB")
-        self.alien4_eq_mid_label.setFixedWidth(35)
-        row = self._create_control_row("EQ Mid", self.alien4_eq_mid_slider, self.alien4_eq_mid_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # EQ High (0 to -20 dB, cut only)
-        self.alien4_eq_high_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_eq_high_slider.setFixedHeight(16)
-        self.alien4_eq_high_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_eq_high_slider, COLOR_COL4)
-        self.alien4_eq_high_slider.setMinimum(-20)
-        self.alien4_eq_high_slider.setMaximum(0)
-        self.alien4_eq_high_slider.setValue(0)
-        self.alien4_eq_high_slider.valueChanged.connect(self._on_alien4_eq_high_changed)
-        self._make_slider_learnable(self.alien4_eq_high_slider, "alien4_eq_high", self._on_alien4_eq_high_changed)
-        self.alien4_eq_high_label = QLabel("0dB")
-        self.alien4_eq_high_label.setFixedWidth(35)
-        row = self._create_control_row("EQ High", self.alien4_eq_high_slider, self.alien4_eq_high_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # SPEED (Playback speed, -8x to +8x)
-        self.alien4_speed_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_speed_slider.setFixedHeight(16)
-        self.alien4_speed_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_speed_slider, COLOR_COL4)
-        self.alien4_speed_slider.setMinimum(-800)  # -8.0x * 100
-        self.alien4_speed_slider.setMaximum(800)   # +8.0x * 100
-        self.alien4_speed_slider.setValue(100)     # 1.0x
-        self.alien4_speed_slider.valueChanged.connect(self._on_alien4_speed_changed)
-        self._make_slider_learnable(self.alien4_speed_slider, "alien4_speed", self._on_alien4_speed_changed)
-        self.alien4_speed_label = QLabel("1.00x")
-        self.alien4_speed_label.setFixedWidth(35)
-        row = self._create_control_row("SPEED", self.alien4_speed_slider, self.alien4_speed_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
-
-        # POLY (Polyphonic voices, 1-8)
-        self.alien4_poly_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_poly_slider.setFixedHeight(16)
-        self.alien4_poly_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_poly_slider, COLOR_COL4)
-        self.alien4_poly_slider.setMinimum(1)
-        self.alien4_poly_slider.setMaximum(8)
-        self.alien4_poly_slider.setValue(1)
-        self.alien4_poly_slider.valueChanged.connect(self._on_alien4_poly_changed)
-        self._make_slider_learnable(self.alien4_poly_slider, "alien4_poly", self._on_alien4_poly_changed)
-        self.alien4_poly_label = QLabel("1")
-        self.alien4_poly_label.setFixedWidth(30)
-        row = self._create_control_row("POLY", self.alien4_poly_slider, self.alien4_poly_label, LABEL_WIDTH)
-        col4_layout.addLayout(row)
+        self._add_control_row(col4_layout, "REC", self.alien4_rec_button, None, LABEL_WIDTH)
+
+        self._add_slider_rows(col4_layout, COLOR_COL4, LABEL_WIDTH, [
+            # SCAN (Slice scan, 0-100%)
+            ("alien4_scan", "SCAN", 0, 100, 0, "0%", 30, None),
+            # LENGTH (Slice length, 0.05-5.0s, default ~0.5s)
+            ("alien4_length", "LEN", 0, 100, 50, "0.50s", 35, self._on_alien4_length_changed),
+            # MIX (Input/Loop mix, 0-100%)
+            ("alien4_mix", "MIX", 0, 100, 0, "0.00", 30, None),
+            # FDBK (Feedback, 0-80%)
+            ("alien4_fdbk", "FDBK", 0, 80, 0, "0.00", 30, None),
+            # EQ Low/Mid/High (0 to -20 dB, cut only)
+            ("alien4_eq_low", "EQ Low", -20, 0, 0, "0dB", 35, None),
+            ("alien4_eq_mid", "EQ Mid", -20, 0, 0, "0dB", 35, None),
+            ("alien4_eq_high", "EQ High", -20, 0, 0, "0dB", 35, None),
+            # SPEED (Playback speed, -8x to +8x in 1/100 steps, default 1.0x)
+            ("alien4_speed", "SPEED", -800, 800, 100, "1.00x", 35, None),
+            # POLY (Polyphonic voices, 1-8)
+            ("alien4_poly", "POLY", 1, 8, 1, "1", 30, None),
+        ])
 
         # ===== COLUMN 5: Alien4 Delay+Reverb =====
 
-        # Delay Time L (0.001-2.0s)
-        self.alien4_delay_time_l_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_delay_time_l_slider.setFixedHeight(16)
-        self.alien4_delay_time_l_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_delay_time_l_slider, COLOR_COL4)
-        self.alien4_delay_time_l_slider.setMinimum(1)  # 0.001s
-        self.alien4_delay_time_l_slider.setMaximum(2000)  # 2.0s
-        self.alien4_delay_time_l_slider.setValue(250)  # 0.25s
-        self.alien4_delay_time_l_slider.valueChanged.connect(self._on_alien4_delay_time_l_changed)
-        self._make_slider_learnable(self.alien4_delay_time_l_slider, "alien4_delay_time_l", self._on_alien4_delay_time_l_changed)
-        self.alien4_delay_time_l_label = QLabel("0.25s")
-        self.alien4_delay_time_l_label.setFixedWidth(35)
-        row = self._create_control_row("Delay Time L", self.alien4_delay_time_l_slider, self.alien4_delay_time_l_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Delay Time R (0.001-2.0s)
-        self.alien4_delay_time_r_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_delay_time_r_slider.setFixedHeight(16)
-        self.alien4_delay_time_r_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_delay_time_r_slider, COLOR_COL4)
-        self.alien4_delay_time_r_slider.setMinimum(1)  # 0.001s
-        self.alien4_delay_time_r_slider.setMaximum(2000)  # 2.0s
-        self.alien4_delay_time_r_slider.setValue(300)  # 0.30s
-        self.alien4_delay_time_r_slider.valueChanged.connect(self._on_alien4_delay_time_r_changed)
-        self._make_slider_learnable(self.alien4_delay_time_r_slider, "alien4_delay_time_r", self._on_alien4_delay_time_r_changed)
-        self.alien4_delay_time_r_label = QLabel("0.30s")
-        self.alien4_delay_time_r_label.setFixedWidth(35)
-        row = self._create_control_row("Delay Time R", self.alien4_delay_time_r_slider, self.alien4_delay_time_r_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Delay FB (0-95%)
-        self.alien4_delay_fb_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_delay_fb_slider.setFixedHeight(16)
-        self.alien4_delay_fb_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_delay_fb_slider, COLOR_COL4)
-        self.alien4_delay_fb_slider.setMinimum(0)
-        self.alien4_delay_fb_slider.setMaximum(95)
-        self.alien4_delay_fb_slider.setValue(30)
-        self.alien4_delay_fb_slider.valueChanged.connect(self._on_alien4_delay_fb_changed)
-        self._make_slider_learnable(self.alien4_delay_fb_slider, "alien4_delay_fb", self._on_alien4_delay_fb_changed)
-        self.alien4_delay_fb_label = QLabel("30%")
-        self.alien4_delay_fb_label.setFixedWidth(30)
-        row = self._create_control_row("Delay FB", self.alien4_delay_fb_slider, self.alien4_delay_fb_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Delay Wet (0-100%)
-        self.alien4_delay_wet_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_delay_wet_slider.setFixedHeight(16)
-        self.alien4_delay_wet_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_delay_wet_slider, COLOR_COL4)
-        self.alien4_delay_wet_slider.setMinimum(0)
-        self.alien4_delay_wet_slider.setMaximum(100)
-        self.alien4_delay_wet_slider.setValue(0)
-        self.alien4_delay_wet_slider.valueChanged.connect(self._on_alien4_delay_wet_changed)
-        self._make_slider_learnable(self.alien4_delay_wet_slider, "alien4_delay_wet", self._on_alien4_delay_wet_changed)
-        self.alien4_delay_wet_label = QLabel("0%")
-        self.alien4_delay_wet_label.setFixedWidth(30)
-        row = self._create_control_row("Delay Wet", self.alien4_delay_wet_slider, self.alien4_delay_wet_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Reverb Decay (0-100%)
-        self.alien4_reverb_decay_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_reverb_decay_slider.setFixedHeight(16)
-        self.alien4_reverb_decay_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_reverb_decay_slider, COLOR_COL4)
-        self.alien4_reverb_decay_slider.setMinimum(0)
-        self.alien4_reverb_decay_slider.setMaximum(100)
-        self.alien4_reverb_decay_slider.setValue(80)
-        self.alien4_reverb_decay_slider.valueChanged.connect(self._on_alien4_reverb_decay_changed)
-        self._make_slider_learnable(self.alien4_reverb_decay_slider, "alien4_reverb_decay", self._on_alien4_reverb_decay_changed)
-        self.alien4_reverb_decay_label = QLabel("80%")
-        self.alien4_reverb_decay_label.setFixedWidth(30)
-        row = self._create_control_row("Reverb Decay", self.alien4_reverb_decay_slider, self.alien4_reverb_decay_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Reverb Wet (0-100%)
-        self.alien4_reverb_wet_slider = QSlider(Qt.Orientation.Horizontal)
-        self.alien4_reverb_wet_slider.setFixedHeight(16)
-        self.alien4_reverb_wet_slider.setFixedWidth(120)
-        self._apply_slider_style(self.alien4_reverb_wet_slider, COLOR_COL4)
-        self.alien4_reverb_wet_slider.setMinimum(0)
-        self.alien4_reverb_wet_slider.setMaximum(100)
-        self.alien4_reverb_wet_slider.setValue(0)
-        self.alien4_reverb_wet_slider.valueChanged.connect(self._on_alien4_reverb_wet_changed)
-        self._make_slider_learnable(self.alien4_reverb_wet_slider, "alien4_reverb_wet", self._on_alien4_reverb_wet_changed)
-        self.alien4_reverb_wet_label = QLabel("0%")
-        self.alien4_reverb_wet_label.setFixedWidth(30)
-        row = self._create_control_row("Reverb Wet", self.alien4_reverb_wet_slider, self.alien4_reverb_wet_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # 新增 Chaos 和 Grain 控制到 Col 5
-
-        # Chaos Rate (0-100%)
-        self.chaos_rate_slider = QSlider(Qt.Orientation.Horizontal)
-        self.chaos_rate_slider.setFixedHeight(16)
-        self.chaos_rate_slider.setFixedWidth(120)
-        self._apply_slider_style(self.chaos_rate_slider, COLOR_COL4)
-        self.chaos_rate_slider.setMinimum(0)
-        self.chaos_rate_slider.setMaximum(100)
-        self.chaos_rate_slider.setValue(1)  # 預設 0.01
-        self.chaos_rate_slider.valueChanged.connect(self._on_chaos_rate_changed)
-        self._make_slider_learnable(self.chaos_rate_slider, "chaos_rate", self._on_chaos_rate_changed)
-        self.chaos_rate_label = QLabel("1%")
-        self.chaos_rate_label.setFixedWidth(30)
-        row = self._create_control_row("Chaos Rate", self.chaos_rate_slider, self.chaos_rate_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
+        self._add_slider_rows(col5_layout, COLOR_COL4, LABEL_WIDTH, [
+            # Delay Time L/R (0.001-2.0s in ms)
+            ("alien4_delay_time_l", "Delay Time L", 1, 2000, 250, "0.25s", 35, None),
+            ("alien4_delay_time_r", "Delay Time R", 1, 2000, 300, "0.30s", 35, None),
+            # Delay FB (0-95%)
+            ("alien4_delay_fb", "Delay FB", 0, 95, 30, "30%", 30, None),
+            # Delay Wet, Reverb Decay, Reverb Wet (0-100%)
+            ("alien4_delay_wet", "Delay Wet", 0, 100, 0, "0%", 30, None),
+            ("alien4_reverb_decay", "Reverb Decay", 0, 100, 80, "80%", 30, None),
+            ("alien4_reverb_wet", "Reverb Wet", 0, 100, 0, "0%", 30, None),
+            # 新增 Chaos 控制到 Col 5: Chaos Rate (0-100%, 預設 0.01)
+            ("chaos_rate", "Chaos Rate", 0, 100, 1, "1%", 30, None),
+        ])
+
+        # Delay times and chaos rate reconfigure the DSP: apply once on release
+        self._apply_on_release("alien4_delay_time_l", "alien4_delay_time_r", "chaos_rate")
 
         # Chaos Shape (toggle button)
         self.chaos_shape_button = QPushButton("Shape: Smooth")
@@ -1009,8 +841,7 @@ class CompactMainWindow(QMainWindow):
         self.chaos_shape_button.setFixedHeight(24)
         self.chaos_shape_button.setFixedWidth(120)
         self.chaos_shape_button.clicked.connect(self._on_chaos_shape_changed)
-        row = self._create_control_row("", self.chaos_shape_button, QLabel(""), LABEL_WIDTH)
-        col5_layout.addLayout(row)
+        self._add_control_row(col5_layout, "", self.chaos_shape_button, QLabel(""), LABEL_WIDTH)
 
         # Delay Chaos (toggle button)
         self.delay_chaos_button = QPushButton("Delay Chaos")
@@ -1018,23 +849,12 @@ class CompactMainWindow(QMainWindow):
         self.delay_chaos_button.setFixedHeight(24)
         self.delay_chaos_button.setFixedWidth(120)
         self.delay_chaos_button.clicked.connect(self._on_delay_chaos_changed)
-        row = self._create_control_row("", self.delay_chaos_button, QLabel(""), LABEL_WIDTH)
-        col5_layout.addLayout(row)
-
-        # Grain Wet (0-100%)
-        self.grain_wet_slider = QSlider(Qt.Orientation.Horizontal)
-        self.grain_wet_slider.setFixedHeight(16)
-        self.grain_wet_slider.setFixedWidth(120)
-        self._apply_slider_style(self.grain_wet_slider, COLOR_COL4)
-        self.grain_wet_slider.setMinimum(0)
-        self.grain_wet_slider.setMaximum(100)
-        self.grain_wet_slider.setValue(0)  # 預設 0
-        self.grain_wet_slider.valueChanged.connect(self._on_grain_wet_changed)
-        self._make_slider_learnable(self.grain_wet_slider, "grain_wet", self._on_grain_wet_changed)
-        self.grain_wet_label = QLabel("0%")
-        self.grain_wet_label.setFixedWidth(30)
-        row = self._create_control_row("Grain Wet", self.grain_wet_slider, self.grain_wet_label, LABEL_WIDTH)
-        col5_layout.addLayout(row)
+        self._add_control_row(col5_layout, "", self.delay_chaos_button, QLabel(""), LABEL_WIDTH)
+
+        # Grain Wet (0-100%, 預設 0)
+        self._add_slider_rows(col5_layout, COLOR_COL4, LABEL_WIDTH, [
+            ("grain_wet", "Grain Wet", 0, 100, 0, "0%", 30, None),
+        ])
 
         # Add all column layouts to the horizontal box
         hbox.addLayout(col1_layout)
@@ -1218,9 +1038,7 @@ class CompactMainWindow(QMainWindow):
             vol_slider.setMinimum(0)
             vol_slider.setMaximum(100)
             vol_slider.setValue(80)
-            vol_slider.valueChanged.connect(
-                lambda val, idx=i: self._on_mixer_volume(idx, val / 100.0)
-            )
+            vol_slider.valueChanged.connect(partial(self._on_mixer_volume, i))
 
             vol_label = QLabel("0.8")
             vol_label.setFixedWidth(28)
@@ -1317,23 +1135,27 @@ class CompactMainWindow(QMainWindow):
         return widget
 
     # Event handlers
+    def _devices_ready(self) -> bool:
+        """True when both audio input and output devices are configured"""
+        audio_io = self.controller.audio_io
+        return bool(audio_io and audio_io.input_device is not None and audio_io.output_device is not None)
+
     def _on_start(self):
         # Check if devices are configured
-        if not self.controller.audio_io or \
-           self.controller.audio_io.input_device is None or \
-           self.controller.audio_io.output_device is None:
+        if not self._devices_ready():
             # Show device selection dialog
             print("[MainWindow] No devices configured, showing device dialog...")
             self._on_select_devices()
 
             # Check again after device selection
-            if not self.controller.audio_io or \
-               self.controller.audio_io.input_device is None or \
-               self.controller.audio_io.output_device is None:
+            if not self._devices_ready():
                 print("[MainWindow] Still no devices configured, cannot start")
                 self.status_label.setText("No devices selected")
                 return
 
+        # Open the CV meters before the first frame/CV update so previews are not dropped
+        self._ensure_cv_meter_window()
+
         # Start the system
         try:
             self.controller.start()
@@ -1344,7 +1166,6 @@ class CompactMainWindow(QMainWindow):
         except Exception as e:
             print(f"[MainWindow] Failed to start: {e}")
             self.status_label.setText(f"Start failed: {e}")
-            import traceback
             traceback.print_exc()
 
     def _on_stop(self):
@@ -1354,78 +1175,91 @@ class CompactMainWindow(QMainWindow):
         self.status_label.setText("Stopped")
 
     def _on_show_video(self):
-        if self.video_window.isVisible():
-            self.video_window.hide()
+        video_window = self._ensure_video_window()
+        if video_window.isVisible():
+            video_window.hide()
             self.show_video_btn.setText("Video")
         else:
-            self.video_window.show()
+            video_window.show()
             self.show_video_btn.setText("Hide Video")
+            # Bring up the CV meters (XY pad, Range, preview) the first time only
+            self._ensure_cv_meter_window()
 
-    def _on_env_global_decay_changed(self, value: int):
+    @staticmethod
+    def _env_decay_time(value: int) -> float:
         """Global ENV decay with exponential mapping
         0-50: 0.01s ~ 1s
         50-100: 1s ~ 5s
         """
-        import numpy as np
         if value <= 50:
             # First half: exponential 0.01 ~ 1.0
             t = value / 50.0
-            decay_time = 0.01 * (100.0 ** t)
-        else:
-            # Second half: exponential 1.0 ~ 5.0
-            t = (value - 50) / 50.0
-            decay_time = 1.0 * (5.0 ** t)
+            return 0.01 * (100.0 ** t)
+        # Second half: exponential 1.0 ~ 5.0
+        t = (value - 50) / 50.0
+        return 1.0 * (5.0 ** t)
+
+    @staticmethod
+    def _slice_length_label(knob_value: float) -> str:
+        """Alien4 slice length label (exponential 0.001 * 5000^knob, 0.001-5.0s)"""
+        slice_length = 0.001 * pow(5000.0, knob_value)
+        if slice_length < 0.01:
+            return f"{slice_length*1000:.1f}ms"
+        if slice_length < 1.0:
+            return f"{slice_length:.2f}s"
+        return f"{slice_length:.1f}s"
+
+    def _on_env_global_decay_changed(self, value: int):
+        """Global ENV decay changed (see _env_decay_time for mapping)"""
+        decay_time = self._env_decay_lut[value]
 
-        # Set all envelopes
-        self.controller.set_global_env_decay(decay_time)
-        self.env_global_label.setText(f"{decay_time:.2f}s")
+        # Set all envelopes (one IPC message per envelope, so coalesce drags)
+        self._queue_controller_set("set_global_env_decay", "set_global_env_decay", decay_time)
+        self._set_label_if_changed(self.env_global_label, self._env_decay_labels[value])
 
     def _on_clock_rate_changed(self, value: int):
         """Scan time in seconds"""
         scan_time = value / 20.0  # 2-6000 -> 0.1-300s (5 minutes)
-        self.controller.set_scan_time(scan_time)
+        self._queue_controller_set("set_scan_time", "set_scan_time", scan_time)
         _, label = self.clock_slider
-        label.setText(f"{scan_time:.1f}s")
+        self._set_label_if_changed(label, self._scan_time_labels[value])
 
     def _on_anchor_xy_changed(self, x_pct: float, y_pct: float):
         """Anchor XY position changed from 2D pad"""
-        print(f"🎮 2D PAD: Anchor position changed to ({x_pct:.1f}%, {y_pct:.1f}%)")
         self.controller.set_anchor_position(x_pct, y_pct)
 
     def _on_range_changed(self, value: int):
         """Sampling range from anchor (1-120%)"""
-        self.controller.set_cv_range(float(value))
+        self._queue_controller_set("set_cv_range", "set_cv_range", float(value))
         _, label = self.range_slider
-        label.setText(f"{value}%")
+        self._set_label_if_changed(label, self._percent_labels[value])
         # Update Visual Preview to show ROI circle
-        self.cv_meter_window.visual_preview.set_range(float(value))
+        if self.cv_meter_window:
+            self.cv_meter_window.visual_preview.set_range(float(value))
 
     def _on_threshold_changed(self, value: int):
         """Edge detection threshold (0-255)"""
         self.controller.set_edge_threshold(value)
         _, label = self.threshold_slider
-        label.setText(str(value))
+        self._set_label_if_changed(label, str(value))
 
     def _on_smoothing_changed(self, value: int):
         """Temporal smoothing (0-100)"""
         self.controller.set_cv_smoothing(value)
         _, label = self.smoothing_slider
-        label.setText(str(value))
+        self._set_label_if_changed(label, str(value))
 
-    def _on_mixer_volume(self, track: int, value: float):
+    def _on_mixer_volume(self, track: int, slider_value: int):
         """Track volume changed - affects BOTH Multiverse intensity and Ellen Ripley mix level"""
-        # Set Multiverse visual intensity
-        if self.controller:
-            self.controller.set_renderer_channel_intensity(track, value)
-            # Set Ellen Ripley mix level
-            self.controller.set_channel_level(track, value)
+        value = slider_value / 100.0
+        # Renderer intensity + mix level are written together by _flush_params
+        self._mixer_pending[track] = value
+        self._schedule_flush()
         # Update label
         _, label = self.mixer_sliders[track]
-        label.setText(f"{value:.1f}")
+        self._set_label_if_changed(label, self._tenth_labels[slider_value])
 
     def _on_select_devices(self):
-        import sounddevice as sd
-
         # Get current device configuration
         # Use device_id if available (camera), otherwise use 0 (video file or no camera)
         camera_device_id = getattr(self.controller.camera, 'device_id', 0) if self.controller.camera else 0
@@ -1475,7 +1309,10 @@ class CompactMainWindow(QMainWindow):
                     self.controller.camera.device_id = devices['camera_input']
                     print(f"  Camera device_id updated to {devices['camera_input']}")
 
-                # Update device status display
+                # Update device status display (re-enumerate, devices changed)
+                _invalidate_device_cache()
+                get_camera_name.cache_clear()
+                self._device_status_text = None
                 self._update_device_status()
 
                 # Show confirmation message and restart if needed
@@ -1488,7 +1325,6 @@ class CompactMainWindow(QMainWindow):
 
             except Exception as e:
                 print(f"Error setting devices: {e}")
-                import traceback
                 traceback.print_exc()
                 self.status_label.setText(f"Error setting devices: {e}")
                 # If restart failed, ensure UI state is correct
@@ -1497,54 +1333,76 @@ class CompactMainWindow(QMainWindow):
                     self.stop_btn.setEnabled(False)
 
     def _update_device_status(self):
-        """Update device status display with current devices"""
-        import sounddevice as sd
-        from ..vision.camera import get_camera_name
+        """Refresh device status display; name lookups run on a worker thread"""
+        # Snapshot device state on the GUI thread
+        audio_io = self.controller.audio_io
+        camera = self.controller.camera
+        input_device = audio_io.input_device if audio_io else None
+        output_device = audio_io.output_device if audio_io else None
+        camera_id = camera.device_id if camera else None
+        # Resolution as read when the source was opened (no extra capture)
+        resolution = camera.get_resolution() if camera and camera.is_opened else (0, 0)
+
+        # Same devices as the text already built: reuse it, no worker
+        key = (input_device, output_device, camera_id, resolution)
+        if key == self._device_status_key and self._device_status_text is not None:
+            self.device_status_label.setText(self._device_status_text)
+            return
 
+        self._device_status_key = key
+        self._device_status_text = None
+        self._device_status_seq += 1
+        threading.Thread(
+            target=self._device_status_worker,
+            args=(self._device_status_seq, input_device, output_device, camera_id, resolution),
+            daemon=True,
+        ).start()
+
+    def _device_status_worker(self, seq: int, input_device, output_device, camera_id, resolution):
+        """Build device status text (audio enumeration and camera name lookup can block)"""
         status_lines = []
         try:
-            all_devices = sd.query_devices()
+            all_devices = _cached_query_devices()
 
             # Audio input
-            if self.controller.audio_io and self.controller.audio_io.input_device is not None:
-                dev = all_devices[self.controller.audio_io.input_device]
+            if input_device is not None:
+                dev = all_devices[input_device]
                 status_lines.append(f"In: {dev['name']}")
 
             # Audio output
-            if self.controller.audio_io and self.controller.audio_io.output_device is not None:
-                dev = all_devices[self.controller.audio_io.output_device]
+            if output_device is not None:
+                dev = all_devices[output_device]
                 status_lines.append(f"Out: {dev['name']}")
         except Exception as e:
             # Fallback to device ID if name lookup fails
-            if self.controller.audio_io and self.controller.audio_io.input_device is not None:
-                status_lines.append(f"In: Device {self.controller.audio_io.input_device}")
-            if self.controller.audio_io and self.controller.audio_io.output_device is not None:
-                status_lines.append(f"Out: Device {self.controller.audio_io.output_device}")
+            if input_device is not None:
+                status_lines.append(f"In: Device {input_device}")
+            if output_device is not None:
+                status_lines.append(f"Out: Device {output_device}")
 
         # Camera input
-        if self.controller.camera and self.controller.camera.device_id is not None:
+        if camera_id is not None:
             try:
                 # Get camera name
-                cam_name = get_camera_name(self.controller.camera.device_id)
-
-                # Get resolution
-                import cv2
-                cap = cv2.VideoCapture(self.controller.camera.device_id)
-                if cap.isOpened():
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                cam_name = get_camera_name(camera_id)
+                width, height = resolution
+                if width and height:
                     status_lines.append(f"{cam_name}: {width}x{height}")
-                    cap.release()
                 else:
                     status_lines.append(f"{cam_name}")
             except Exception as e:
                 # Fallback
-                status_lines.append(f"Camera {self.controller.camera.device_id}")
+                status_lines.append(f"Camera {camera_id}")
 
-        if status_lines:
-            self.device_status_label.setText(" | ".join(status_lines))
-        else:
-            self.device_status_label.setText("No devices")
+        text = " | ".join(status_lines) if status_lines else "No devices"
+        # Emit signal to update GUI in main thread (thread-safe)
+        self.device_status_updated.emit(seq, text)
+
+    def _on_device_status_ready(self, seq: int, text: str):
+        """Show device status text unless a newer refresh has been requested"""
+        if seq == self._device_status_seq:
+            self._device_status_text = text
+            self.device_status_label.setText(text)
 
     def _on_toggle_virtual_camera(self, checked: bool):
         if checked:
@@ -1561,9 +1419,6 @@ class CompactMainWindow(QMainWindow):
     def _on_load_video(self):
         """Load video file as input source"""
         try:
-            from PyQt6.QtWidgets import QFileDialog
-            from PyQt6.QtCore import QTimer
-
             video_path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Select Video File",
@@ -1588,7 +1443,6 @@ class CompactMainWindow(QMainWindow):
                 QTimer.singleShot(100, do_switch)
 
         except Exception as e:
-            import traceback
             print(f"Error in _on_load_video: {e}")
             traceback.print_exc()
             self.status_label.setText(f"Error: {str(e)}")
@@ -1596,8 +1450,6 @@ class CompactMainWindow(QMainWindow):
     def _on_switch_camera(self):
         """Switch back to camera input"""
         try:
-            from PyQt6.QtCore import QTimer
-
             print("Switching to camera...")
             self.status_label.setText("Switching to camera...")
 
@@ -1614,40 +1466,17 @@ class CompactMainWindow(QMainWindow):
             QTimer.singleShot(100, do_switch)
 
         except Exception as e:
-            import traceback
             print(f"Error in _on_switch_camera: {e}")
             traceback.print_exc()
             self.status_label.setText(f"Error: {str(e)}")
 
-    def _on_multiverse_toggle(self, state: int):
-        enabled = (state == Qt.CheckState.Checked.value)
+    def _on_multiverse_toggle(self, enabled: bool):
         self.controller.enable_multiverse_rendering(enabled)
         mode = "Multiverse" if enabled else "Simple"
         self.status_label.setText(f"Rendering: {mode}")
 
-    def _on_blend_mode_changed(self, value: int):
-        # Convert 0-100 to 0.0-1.0 for continuous blend
-        blend_value = value / 100.0
-        self.controller.set_renderer_blend_mode(blend_value)
-
-    def _on_color_scheme_changed(self, value: int):
-        # Convert 0-100 to 0.0-1.0 for continuous color scheme blend
-        scheme_value = value / 100.0
-        self.controller.set_color_scheme(scheme_value)
-
-    def _on_brightness_changed(self, value: int):
-        brightness = value / 100.0
-        self.brightness_label.setText(f"{brightness:.1f}")
-        self.controller.set_renderer_brightness(brightness)
-
-    def _on_base_hue_changed(self, value: int):
-        hue = value / 333.0  # Convert 0-333 to 0.0-1.0
-        self.base_hue_label.setText(f"{value}")
-        self.controller.set_renderer_base_hue(hue)
-
-    def _on_region_rendering_toggle(self, state: int):
+    def _on_region_rendering_toggle(self, enabled: bool):
         """Toggle region-based rendering - fixed to brightness mode"""
-        enabled = state == Qt.CheckState.Checked.value
         self.controller.enable_region_rendering(enabled)
         # Always set mode to brightness
         if enabled:
@@ -1665,230 +1494,183 @@ class CompactMainWindow(QMainWindow):
         """Channel curve changed"""
         curve = value / 100.0
         _, label = self.channel_curve_sliders[channel]
-        label.setText(f"{curve:.1f}")
-        self.controller.set_renderer_channel_curve(channel, curve)
+        self._set_label_if_changed(label, self._tenth_labels[value])
+        self._queue_controller_set(("curve", channel), "set_renderer_channel_curve", channel, curve)
 
     def _on_channel_angle_changed(self, channel: int, value: int):
         """Channel angle changed"""
         _, label = self.channel_angle_sliders[channel]
-        label.setText(f"{value}°")
+        self._set_label_if_changed(label, self._angle_labels[value + 180])
         # Map 0-360 to -180 to +180 (like original Multiverse)
         mapped_angle = float(value) - 180.0
-        self.controller.set_renderer_channel_angle(channel, mapped_angle)
-
-    def _on_camera_mix_changed(self, value: int):
-        """Camera mix changed"""
-        camera_mix = value / 100.0  # 0-30 slider -> 0.0-0.3
-        self.camera_mix_label.setText(f"{camera_mix:.2f}")
-        self.controller.set_renderer_camera_mix(camera_mix)
+        self._queue_controller_set(("angle", channel), "set_renderer_channel_angle", channel, mapped_angle)
 
     # Ellen Ripley event handlers
-    def _on_ellen_ripley_toggle(self, state: int):
-        enabled = state == 2
+    def _on_ellen_ripley_toggle(self, enabled: bool):
         self.controller.enable_ellen_ripley(enabled)
         self.status_label.setText(f"Ellen Ripley: {'ON' if enabled else 'OFF'}")
 
     def _on_er_delay_time_l_changed(self, value: int):
         time_s = value / 1000.0
-        self.er_delay_time_l_label.setText(f"{time_s:.2f}s")
+        self._set_label_if_changed(self.er_delay_time_l_label, f"{time_s:.2f}s")
         self.controller.set_ellen_ripley_delay_params(time_l=time_s)
 
     def _on_er_delay_time_r_changed(self, value: int):
         time_s = value / 1000.0
-        self.er_delay_time_r_label.setText(f"{time_s:.2f}s")
+        self._set_label_if_changed(self.er_delay_time_r_label, f"{time_s:.2f}s")
         self.controller.set_ellen_ripley_delay_params(time_r=time_s)
 
     def _on_er_delay_fb_changed(self, value: int):
         fb = value / 100.0
-        self.er_delay_fb_label.setText(f"{fb:.2f}")
+        self._set_label_if_changed(self.er_delay_fb_label, f"{fb:.2f}")
         self.controller.set_ellen_ripley_delay_params(feedback=fb)
 
-    def _on_er_delay_chaos_changed(self, state: int):
-        enabled = state == 2
+    def _on_er_delay_chaos_changed(self, enabled: bool):
         self.controller.set_ellen_ripley_delay_params(chaos_enabled=enabled)
 
     def _on_er_delay_mix_changed(self, value: int):
         mix = value / 100.0
-        self.er_delay_mix_label.setText(f"{mix:.2f}")
+        self._set_label_if_changed(self.er_delay_mix_label, f"{mix:.2f}")
         self.controller.set_ellen_ripley_delay_params(wet_dry=mix)
 
     def _on_er_grain_size_changed(self, value: int):
         size = value / 100.0
-        self.er_grain_size_label.setText(f"{size:.2f}")
+        self._set_label_if_changed(self.er_grain_size_label, f"{size:.2f}")
         self.controller.set_ellen_ripley_grain_params(size=size)
 
     def _on_er_grain_density_changed(self, value: int):
         density = value / 100.0
-        self.er_grain_density_label.setText(f"{density:.2f}")
+        self._set_label_if_changed(self.er_grain_density_label, f"{density:.2f}")
         self.controller.set_ellen_ripley_grain_params(density=density)
 
     def _on_er_grain_pos_changed(self, value: int):
         pos = value / 100.0
-        self.er_grain_pos_label.setText(f"{pos:.2f}")
+        self._set_label_if_changed(self.er_grain_pos_label, f"{pos:.2f}")
         self.controller.set_ellen_ripley_grain_params(position=pos)
 
-    def _on_er_grain_chaos_changed(self, state: int):
-        enabled = state == 2
+    def _on_er_grain_chaos_changed(self, enabled: bool):
         self.controller.set_ellen_ripley_grain_params(chaos_enabled=enabled)
 
     def _on_er_grain_mix_changed(self, value: int):
         mix = value / 100.0
-        self.er_grain_mix_label.setText(f"{mix:.2f}")
+        self._set_label_if_changed(self.er_grain_mix_label, f"{mix:.2f}")
         self.controller.set_ellen_ripley_grain_params(wet_dry=mix)
 
     def _on_er_reverb_room_changed(self, value: int):
         room = value / 100.0
-        self.er_reverb_room_label.setText(f"{room:.2f}")
+        self._set_label_if_changed(self.er_reverb_room_label, f"{room:.2f}")
         self.controller.set_ellen_ripley_reverb_params(room_size=room)
 
     def _on_er_reverb_damp_changed(self, value: int):
         damp = value / 100.0
-        self.er_reverb_damp_label.setText(f"{damp:.2f}")
+        self._set_label_if_changed(self.er_reverb_damp_label, f"{damp:.2f}")
         self.controller.set_ellen_ripley_reverb_params(damping=damp)
 
     def _on_er_reverb_decay_changed(self, value: int):
         decay = value / 100.0
-        self.er_reverb_decay_label.setText(f"{decay:.2f}")
+        self._set_label_if_changed(self.er_reverb_decay_label, f"{decay:.2f}")
         self.controller.set_ellen_ripley_reverb_params(decay=decay)
 
-    def _on_er_reverb_chaos_changed(self, state: int):
-        enabled = state == 2
+    def _on_er_reverb_chaos_changed(self, enabled: bool):
         self.controller.set_ellen_ripley_reverb_params(chaos_enabled=enabled)
 
     def _on_er_reverb_mix_changed(self, value: int):
         mix = value / 100.0
-        self.er_reverb_mix_label.setText(f"{mix:.2f}")
+        self._set_label_if_changed(self.er_reverb_mix_label, f"{mix:.2f}")
         self.controller.set_ellen_ripley_reverb_params(wet_dry=mix)
 
     def _on_er_chaos_rate_changed(self, value: int):
         rate = value / 100.0
-        self.er_chaos_rate_label.setText(f"{rate:.2f}")
+        self._set_label_if_changed(self.er_chaos_rate_label, f"{rate:.2f}")
         self.controller.set_ellen_ripley_chaos_params(rate=rate)
 
     def _on_er_chaos_amount_changed(self, value: int):
         amount = value / 100.0
-        self.er_chaos_amount_label.setText(f"{amount:.2f}")
+        self._set_label_if_changed(self.er_chaos_amount_label, f"{amount:.2f}")
         self.controller.set_ellen_ripley_chaos_params(amount=amount)
 
-    def _on_er_chaos_shape_changed(self, state: int):
-        shape = state == 2
+    def _on_er_chaos_shape_changed(self, shape: bool):
         self.controller.set_ellen_ripley_chaos_params(shape=shape)
 
     # Alien4 event handlers
+    def _queue_controller_call(self, setter: str, **kwargs):
+        """Queue a controller parameter write; repeated writes merge until the next flush"""
+        self._pending_params.setdefault(setter, {}).update(kwargs)
+        self._schedule_flush()
+
+    def _queue_controller_set(self, key, setter: str, *args):
+        """Queue a positional controller write; only the latest args per key are applied"""
+        self._pending_calls[key] = (setter, args)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Start the flush timer unless a flush is already pending"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_params(self):
+        """Apply queued controller parameter writes, one call per setter / key / mixer track"""
+        controller = self.controller
+
+        pending, self._pending_params = self._pending_params, {}
+        for setter, kwargs in pending.items():
+            getattr(controller, setter)(**kwargs)
+
+        calls, self._pending_calls = self._pending_calls, {}
+        for setter, args in calls.values():
+            getattr(controller, setter)(*args)
+
+        mixer, self._mixer_pending = self._mixer_pending, {}
+        for track, value in mixer.items():
+            # Set Multiverse visual intensity
+            controller.set_renderer_channel_intensity(track, value)
+            # Set Ellen Ripley mix level
+            controller.set_channel_level(track, value)
+
+    def _on_param_changed(self, name: str, value: int):
+        """Generic slider handler for parameters listed in _PARAM_TABLE"""
+        setter, kwarg, divisor, _ = self._PARAM_TABLE[name]
+        self._preview_param_label(name, value)
+        scaled = value if divisor is None else value / divisor
+        if kwarg is None:
+            self._queue_controller_set(setter, setter, scaled)
+        else:
+            self._queue_controller_call(setter, **{kwarg: scaled})
+
+    def _preview_param_label(self, name: str, value: int):
+        """Update a _PARAM_TABLE value label only (no controller write)"""
+        entry = self._param_labels.get(name)
+        if entry is None:
+            return  # No value label for this parameter
+        minimum, labels = entry
+        self._set_label_if_changed(getattr(self, f"{name}_label"), labels[value - minimum])
+
+    def _build_param_labels(self, name: str, minimum: int, maximum: int) -> tuple:
+        """Precompute the value label text for every slider position of a _PARAM_TABLE entry"""
+        _, _, divisor, fmt = self._PARAM_TABLE[name]
+        return tuple(
+            fmt.format(v=v, x=v if divisor is None else v / divisor)
+            for v in range(minimum, maximum + 1)
+        )
+
     def _on_alien4_rec_toggle(self):
         """Toggle Alien4 recording"""
         enabled = self.alien4_rec_button.isChecked()
         self.controller.set_alien4_recording(enabled)
         self.status_label.setText(f"Alien4 REC: {'ON' if enabled else 'OFF'}")
 
-    def _on_alien4_scan_changed(self, value: int):
-        """Alien4 scan changed"""
-        scan = value / 100.0
-        self.alien4_scan_label.setText(f"{value}%")
-        self.controller.set_alien4_scan(scan)
-
     def _on_alien4_length_changed(self, value: int):
         """Alien4 slice length changed (0.001-5.0s)"""
         # Convert 0-100 slider to 0.0-1.0 knob value
         knob_value = value / 100.0
 
-        # Calculate actual slice length for display (0.001-5.0s)
-        # Exponential: 0.001 * 5000^knob_value
-        slice_length = 0.001 * pow(5000.0, knob_value)
-
-        # Display slice length
-        if slice_length < 0.01:
-            self.alien4_length_label.setText(f"{slice_length*1000:.1f}ms")
-        elif slice_length < 1.0:
-            self.alien4_length_label.setText(f"{slice_length:.2f}s")
-        else:
-            self.alien4_length_label.setText(f"{slice_length:.1f}s")
+        # Display slice length (see _slice_length_label for mapping)
+        self._set_label_if_changed(self.alien4_length_label, self._slice_length_labels[value])
 
         # Send knob value to engine
-        self.controller.set_alien4_gate_threshold(knob_value)
-
-    def _on_alien4_mix_changed(self, value: int):
-        """Alien4 loop mix changed"""
-        mix = value / 100.0
-        self.alien4_mix_label.setText(f"{mix:.2f}")
-        self.controller.set_alien4_documenta_params(mix=mix)
-
-    def _on_alien4_fdbk_changed(self, value: int):
-        """Alien4 feedback changed (slider 0-80 maps to 0.0-0.8)"""
-        # Map 0-80 to 0.0-0.8
-        fdbk = value / 100.0  # 0-80 → 0.0-0.8
-        self.alien4_fdbk_label.setText(f"{fdbk:.2f}")
-        self.controller.set_alien4_documenta_params(feedback=fdbk)
-
-    def _on_alien4_eq_low_changed(self, value: int):
-        """Alien4 EQ Low changed"""
-        self.alien4_eq_low_label.setText(f"{value}dB")
-        self.controller.set_alien4_documenta_params(eq_low=float(value))
-
-    def _on_alien4_eq_mid_changed(self, value: int):
-        """Alien4 EQ Mid changed"""
-        self.alien4_eq_mid_label.setText(f"{value}dB")
-        self.controller.set_alien4_documenta_params(eq_mid=float(value))
-
-    def _on_alien4_eq_high_changed(self, value: int):
-        """Alien4 EQ High changed"""
-        self.alien4_eq_high_label.setText(f"{value}dB")
-        self.controller.set_alien4_documenta_params(eq_high=float(value))
-
-    def _on_alien4_speed_changed(self, value: int):
-        """Alien4 speed changed"""
-        speed = value / 100.0
-        self.alien4_speed_label.setText(f"{speed:.2f}x")
-        self.controller.set_alien4_documenta_params(speed=speed)
-
-    def _on_alien4_delay_time_l_changed(self, value: int):
-        """Alien4 delay time L changed"""
-        time_s = value / 1000.0
-        self.alien4_delay_time_l_label.setText(f"{time_s:.2f}s")
-        self.controller.set_alien4_delay_params(time_l=time_s)
-
-    def _on_alien4_delay_time_r_changed(self, value: int):
-        """Alien4 delay time R changed"""
-        time_s = value / 1000.0
-        self.alien4_delay_time_r_label.setText(f"{time_s:.2f}s")
-        self.controller.set_alien4_delay_params(time_r=time_s)
-
-    def _on_alien4_delay_fb_changed(self, value: int):
-        """Alien4 delay feedback changed"""
-        fb = value / 100.0
-        self.alien4_delay_fb_label.setText(f"{value}%")
-        self.controller.set_alien4_delay_params(feedback=fb)
-
-    def _on_alien4_delay_wet_changed(self, value: int):
-        """Alien4 delay wet changed (Ellen Ripley)"""
-        wet = value / 100.0
-        self.alien4_delay_wet_label.setText(f"{value}%")
-        self.controller.set_ellen_ripley_delay_params(wet_dry=wet)
-
-    def _on_alien4_reverb_decay_changed(self, value: int):
-        """Alien4 reverb decay changed"""
-        decay = value / 100.0
-        self.alien4_reverb_decay_label.setText(f"{value}%")
-        self.controller.set_alien4_reverb_params(decay=decay)
-
-    def _on_alien4_reverb_wet_changed(self, value: int):
-        """Alien4 reverb wet changed (Ellen Ripley)"""
-        wet = value / 100.0
-        self.alien4_reverb_wet_label.setText(f"{value}%")
-        self.controller.set_ellen_ripley_reverb_params(wet_dry=wet)
-
-    def _on_alien4_poly_changed(self, value: int):
-        """Alien4 poly voices changed"""
-        self.alien4_poly_label.setText(f"{value}")
-        self.controller.set_alien4_documenta_params(poly=value)
+        self._queue_controller_call("set_alien4_gate_threshold", value=knob_value)
 
     # Chaos controls
-    def _on_chaos_rate_changed(self, value: int):
-        """Chaos rate changed"""
-        rate = value / 100.0
-        self.chaos_rate_label.setText(f"{value}%")
-        self.controller.set_alien4_chaos_params(rate=rate)
-
     def _on_chaos_shape_changed(self, checked: bool):
         """Chaos shape changed"""
         shape_text = "Stepped" if checked else "Smooth"
@@ -1899,17 +1681,9 @@ class CompactMainWindow(QMainWindow):
         """Delay chaos toggle changed"""
         self.controller.set_alien4_delay_params(chaos_enabled=checked)
 
-    # Grain controls
-    def _on_grain_wet_changed(self, value: int):
-        """Grain wet changed (Ellen Ripley)"""
-        wet = value / 100.0
-        self.grain_wet_label.setText(f"{value}%")
-        self.controller.set_ellen_ripley_grain_params(wet_dry=wet)
-
     # SD img2img controls
-    def _on_sd_toggle(self, state: int):
+    def _on_sd_toggle(self, enabled: bool):
         """SD img2img enable/disable"""
-        enabled = state == 2
         if hasattr(self.controller, "set_sd_enabled"):
             self.controller.set_sd_enabled(enabled)
         else:
@@ -1917,57 +1691,48 @@ class CompactMainWindow(QMainWindow):
             print(f"SD img2img {status} (not yet implemented in controller)")
 
     def _on_sd_prompt_changed(self):
-        """SD prompt changed"""
+        """SD prompt changed (debounced: 300ms after the last keystroke)"""
         prompt = self.sd_prompt_edit.toPlainText()
         if hasattr(self.controller, "set_sd_prompt"):
             self.controller.set_sd_prompt(prompt)
 
-    def _on_sd_steps_changed(self, value: int):
-        """SD steps changed"""
-        self.sd_steps_label.setText(str(value))
-        if hasattr(self.controller, "set_sd_parameters"):
-            self.controller.set_sd_parameters(num_steps=value)
-
-    def _on_sd_strength_changed(self, value: int):
-        """SD strength changed"""
-        strength = value / 100.0
-        self.sd_strength_label.setText(f"{strength:.2f}")
-        if hasattr(self.controller, "set_sd_parameters"):
-            self.controller.set_sd_parameters(strength=strength)
-
-    def _on_sd_guidance_changed(self, value: int):
-        """SD guidance changed"""
-        guidance = value / 10.0
-        self.sd_guidance_label.setText(f"{guidance:.1f}")
-        if hasattr(self.controller, "set_sd_parameters"):
-            self.controller.set_sd_parameters(guidance_scale=guidance)
-
-    def _on_sd_interval_changed(self, text: str):
-        """SD generation interval changed"""
-        try:
-            interval = float(text)
-            if hasattr(self.controller, "set_sd_interval"):
-                self.controller.set_sd_interval(interval)
-        except ValueError:
-            pass
+    def _on_sd_interval_changed(self):
+        """SD generation interval changed (debounced: 300ms after the last keystroke)"""
+        if not self.sd_interval_edit.hasAcceptableInput():
+            return  # Partial entry such as "" or "0.": keep the current interval
+        interval = float(self.sd_interval_edit.text())
+        if hasattr(self.controller, "set_sd_interval"):
+            self.controller.set_sd_interval(interval)
 
     # Controller callbacks
     def _on_frame(self, frame: np.ndarray):
-        self.frame_updated.emit(frame)
+        if self._closing:
+            return
+        self._latest_frame = frame
+        if not self._paint_pending:
+            self._paint_pending = True
+            self.frame_updated.emit()
 
     def _on_cv(self, cv_values: np.ndarray):
-        self.cv_updated.emit(cv_values)
+        if self._closing:
+            return
+        self._latest_cv = cv_values
+        if not self._cv_pending:
+            self._cv_pending = True
+            self.cv_updated.emit()
 
     def _on_visual(self, visual_params: dict):
-        self.visual_updated.emit(visual_params)
+        if not self._closing:
+            self.visual_updated.emit(visual_params)
 
     def _on_param(self, param_name: str, channel: int, value: float):
-        self.param_updated.emit(param_name, channel, value)
+        if not self._closing:
+            self.param_updated.emit(param_name, channel, value)
 
     # Timer event handlers
     def _on_scene_threshold_changed(self, value: int):
         """Scene change threshold changed (1-10%)"""
-        self.scene_threshold_label.setText(f"{value}%")
+        self._set_label_if_changed(self.scene_threshold_label, self._percent_labels[value])
         if hasattr(self, 'controller') and self.controller and self.controller.contour_cv_generator:
             self.controller.contour_cv_generator.scene_change_threshold = float(value)
 
@@ -1976,20 +1741,19 @@ class CompactMainWindow(QMainWindow):
         ratio = value / 100.0  # 10-100 -> 0.1-1.0
         # Display as fraction
         if ratio >= 0.99:
-            self.chaos_ratio_label.setText("1/1")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/1")
         elif ratio >= 0.49:
-            self.chaos_ratio_label.setText("1/2")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/2")
         elif ratio >= 0.32:
-            self.chaos_ratio_label.setText("1/3")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/3")
         elif ratio >= 0.24:
-            self.chaos_ratio_label.setText("1/4")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/4")
         elif ratio >= 0.19:
-            self.chaos_ratio_label.setText("1/5")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/5")
         else:
-            self.chaos_ratio_label.setText("1/10")
+            self._set_label_if_changed(self.chaos_ratio_label, "1/10")
 
-        if hasattr(self, 'controller') and self.controller:
-            self.controller.set_chaos_ratio(ratio)
+        self._queue_controller_set("set_chaos_ratio", "set_chaos_ratio", ratio)
 
     def _on_timer_toggle(self):
         """Toggle timer start/stop"""
@@ -2022,10 +1786,9 @@ class CompactMainWindow(QMainWindow):
                 self.blend_mode_slider.setValue(0)
                 self.base_hue_slider.setValue(0)
 
-                # Start QTimer
-                import time
-                self.timer_start_time = time.time()
-                self.timer_updater.start()
+                # Start QTimer (monotonic: immune to wall-clock adjustments)
+                self.timer_start_time = time.monotonic()
+                self._update_timer()
 
             except ValueError:
                 pass
@@ -2046,20 +1809,41 @@ class CompactMainWindow(QMainWindow):
         # Reset display
         self.timer_display.setText("00:00")
 
+    def _set_timer_sliders(self, progress: float):
+        """Move the timer-animated sliders to progress (0-1) of their targets
+
+        The sliders' own _on_param_changed handlers queue the controller writes into
+        the next 16ms flush; an unchanged position emits nothing and writes nothing
+        """
+        self.color_scheme_slider.setValue(int(progress * self.timer_target_color_scheme))
+        self.blend_mode_slider.setValue(int(progress * self.timer_target_blend_mode))
+        self.base_hue_slider.setValue(int(progress * self.timer_target_base_hue))
+
+    def _next_timer_wakeup_ms(self, elapsed: float) -> int:
+        """Milliseconds until the countdown text or a timer slider next changes"""
+        total = self.timer_total
+        remaining = total - elapsed
+        # Countdown shows whole seconds: next change when remaining drops below its floor
+        next_event = elapsed + ((remaining - int(remaining)) or 1.0)
+        # Each slider shows int(progress * target): next change at its next integer step
+        for target in (self.timer_target_color_scheme, self.timer_target_blend_mode,
+                       self.timer_target_base_hue):
+            step = int(elapsed / total * target) + 1
+            next_event = min(next_event, step * total / target)
+        # No faster than the 16ms parameter flush that carries the slider writes
+        return max(16, int((next_event - elapsed) * 1000.0 + 0.999))
+
     def _update_timer(self):
-        """Update timer display (called every 100ms)"""
+        """Update timer display, then sleep until the next visible change"""
         if not self.timer_running:
             return
 
-        import time
-        elapsed = time.time() - self.timer_start_time
+        elapsed = time.monotonic() - self.timer_start_time
         remaining = max(0, self.timer_total - elapsed)
 
         if remaining <= 0:
             # Timer finished - set to max values
-            self.color_scheme_slider.setValue(self.timer_target_color_scheme)
-            self.blend_mode_slider.setValue(self.timer_target_blend_mode)
-            self.base_hue_slider.setValue(self.timer_target_base_hue)
+            self._set_timer_sliders(1.0)
 
             self._stop_timer()
             self.timer_display.setText("00:00")
@@ -2070,80 +1854,103 @@ class CompactMainWindow(QMainWindow):
         progress = (self.timer_total - remaining) / self.timer_total
 
         # Update parameters linearly from 0 to max
-        color_scheme_value = int(progress * self.timer_target_color_scheme)
-        blend_mode_value = int(progress * self.timer_target_blend_mode)
-        base_hue_value = int(progress * self.timer_target_base_hue)
-
-        # Update sliders (block signals to avoid feedback)
-        self.color_scheme_slider.blockSignals(True)
-        self.blend_mode_slider.blockSignals(True)
-        self.base_hue_slider.blockSignals(True)
-
-        self.color_scheme_slider.setValue(color_scheme_value)
-        self.blend_mode_slider.setValue(blend_mode_value)
-        self.base_hue_slider.setValue(base_hue_value)
-
-        self.color_scheme_slider.blockSignals(False)
-        self.blend_mode_slider.blockSignals(False)
-        self.base_hue_slider.blockSignals(False)
-
-        # Manually trigger updates to controller
-        self.controller.set_color_scheme(color_scheme_value / 100.0)
-        self.controller.set_renderer_blend_mode(blend_mode_value / 100.0)
-        self.controller.set_renderer_base_hue(base_hue_value / 333.0)
+        self._set_timer_sliders(progress)
 
         # Update display
         minutes = int(remaining // 60)
         seconds = int(remaining % 60)
-        self.timer_display.setText(f"{minutes:02d}:{seconds:02d}")
+        self._set_label_if_changed(self.timer_display, f"{minutes:02d}:{seconds:02d}")
 
         # Change color when less than 1 minute
-        if remaining < 60:
-            self.timer_display.setStyleSheet("font-size: 16px; font-weight: bold; color: orange;")
-        else:
-            self.timer_display.setStyleSheet("font-size: 16px; font-weight: bold;")
+        # (setStyleSheet re-polishes the widget even for the same sheet, so compare first)
+        style = ("font-size: 16px; font-weight: bold; color: orange;" if remaining < 60
+                 else "font-size: 16px; font-weight: bold;")
+        if self.timer_display.styleSheet() != style:
+            self.timer_display.setStyleSheet(style)
+
+        self.timer_updater.start(self._next_timer_wakeup_ms(elapsed))
 
     # Qt slots
+    def _paint_latest_frame(self):
+        """Display the newest frame; frames superseded while queued are skipped"""
+        # Clear the flag before taking the frame so a frame arriving meanwhile queues another paint
+        self._paint_pending = False
+        frame = self._latest_frame
+        if frame is not None:
+            self._update_frame_display(frame)
+
     def _update_frame_display(self, frame: np.ndarray):
         # Frame is already rendered (Simple or Multiverse mode) by controller
         # Just display it directly
-        height, width = frame.shape[:2]
-        bytes_per_line = 3 * width
-        q_image = QImage(frame.data, width, height, bytes_per_line,
-                        QImage.Format.Format_RGB888).rgbSwapped()
-        self.video_label.setPixmap(QPixmap.fromImage(q_image))
+        # Frames are BGR (OpenCV order); no rgbSwapped() copy is needed (see BGRX below)
+        # Resize once in OpenCV to the label's device pixels instead of letting
+        # setScaledContents rescale the full-size pixmap on every paint
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)  # QImage needs packed pixels (e.g. cropped/flipped views)
+        # Video window never opened or hidden: only the preview needs the frame
+        video_visible = self.video_window is not None and self.video_window.isVisible()
+        dpr = target_w = target_h = 0
+        if video_visible:
+            dpr = self.video_label.devicePixelRatioF()
+            target_w = max(1, int(self.video_label.width() * dpr))
+            target_h = max(1, int(self.video_label.height() * dpr))
+
+        # Frozen source (stopped, paused video): skip the resize, blit and repaint when a
+        # 1/256 pixel sample and the display size match the frame already shown
+        frame_key = (hashlib.blake2b(frame[::16, ::16].tobytes(), digest_size=8).digest(),
+                     frame.shape, target_w, target_h)
+        if frame_key == self._last_frame_key:
+            return
+        self._last_frame_key = frame_key
+
+        if video_visible:
+            display = frame
+            if (display.shape[1], display.shape[0]) != (target_w, target_h):
+                shrinking = target_w < display.shape[1]
+                display = cv2.resize(display, (target_w, target_h),
+                                     interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+            # Expand to 32-bit BGRX (Format_RGB32 byte order on little-endian) with OpenCV's
+            # SIMD cvtColor so fromImage can take the pixmap's native format as is
+            height, width = display.shape[:2]
+            if self._display_buf is None or self._display_buf.shape[:2] != (height, width):
+                self._display_buf = np.empty((height, width, 4), dtype=np.uint8)
+            cv2.cvtColor(display, cv2.COLOR_BGR2BGRA, dst=self._display_buf)
+            q_image = QImage(self._display_buf.data, width, height, self._display_buf.strides[0],
+                             QImage.Format.Format_RGB32)
+            pixmap = QPixmap.fromImage(q_image, Qt.ImageConversionFlag.NoFormatConversion)
+            pixmap.setDevicePixelRatio(dpr)
+            self.video_label.setPixmap(pixmap)
 
         # Update visual preview in CV meter window
         if self.cv_meter_window:
             self.cv_meter_window.update_visual_preview(frame)
 
+    def _show_latest_cv(self):
+        """Display the newest CV values; updates superseded while queued are skipped"""
+        self._cv_pending = False
+        cv_values = self._latest_cv
+        if cv_values is not None:
+            self._update_cv_display(cv_values)
+
     def _update_cv_display(self, cv_values: np.ndarray):
         """Update CV Meter Window with new CV values"""
-        if self.cv_meter_window:
-            self.cv_meter_window.update_values(cv_values)
+        self._ensure_cv_meter_window().update_values(cv_values)
 
         # Update Alien4 Scan and Len sliders from Seq1 (cv_values[4])
         if len(cv_values) > 4:
             seq1_value = cv_values[4]
 
             # Update Scan slider
-            self.alien4_scan_slider.blockSignals(True)
-            self.alien4_scan_slider.setValue(int(seq1_value * 100))
-            self.alien4_scan_label.setText(f"{int(seq1_value * 100)}%")
-            self.alien4_scan_slider.blockSignals(False)
+            seq1_pos = min(max(int(seq1_value * 100), 0), 100)
+            with QSignalBlocker(self.alien4_scan_slider):
+                self.alien4_scan_slider.setValue(seq1_pos)
+            self._set_label_if_changed(self.alien4_scan_label, self._percent_labels[seq1_pos])
 
             # Update Len slider
-            self.alien4_length_slider.blockSignals(True)
-            self.alien4_length_slider.setValue(int(seq1_value * 100))
-            # Calculate and display slice length (same formula as _on_alien4_length_changed)
-            slice_length = 0.001 * pow(5000.0, seq1_value)
-            if slice_length < 0.01:
-                self.alien4_length_label.setText(f"{slice_length*1000:.1f}ms")
-            elif slice_length < 1.0:
-                self.alien4_length_label.setText(f"{slice_length:.2f}s")
-            else:
-                self.alien4_length_label.setText(f"{slice_length:.1f}s")
-            self.alien4_length_slider.blockSignals(False)
+            with QSignalBlocker(self.alien4_length_slider):
+                self.alien4_length_slider.setValue(seq1_pos)
+            # Display slice length at the slider position (same table as _on_alien4_length_changed)
+            self._set_label_if_changed(self.alien4_length_label, self._slice_length_labels[seq1_pos])
 
     def _update_visual_display(self, visual_params: dict):
         pass
@@ -2157,26 +1964,53 @@ class CompactMainWindow(QMainWindow):
         if param_name == "curve":
             # 顯示當前實際 curve 值 (0-1)
             _, label = self.channel_curve_sliders[channel]
-            label.setText(f"{value:.2f}")
+            index = int(value * 100.0 + 0.5)
+            text = self._hundredth_labels[index] if 0 <= index <= 100 else f"{value:.2f}"
+            self._set_label_if_changed(label, text)
         elif param_name == "angle":
             # 顯示當前實際 angle 值 (-180 到 +180)
             _, label = self.channel_angle_sliders[channel]
-            label.setText(f"{int(value)}°")
+            index = int(value) + 180
+            text = self._angle_labels[index] if 0 <= index <= 540 else f"{int(value)}°"
+            self._set_label_if_changed(label, text)
 
-    def _on_cv_overlay_toggle(self, state: int):
+    def _on_cv_overlay_toggle(self, enabled: bool):
         """Toggle CV overlay display on main visual"""
-        enabled = (state == Qt.CheckState.Checked.value)
         self.controller.enable_cv_overlay(enabled)
 
     def closeEvent(self, event):
         """Close all windows and stop controller"""
-        self.controller.stop()
+        # Hide first and stop the controller off the GUI thread: joining the audio
+        # process and releasing the camera can take seconds
+        self.hide()
+
+        # Worker threads keep running until stop() returns: detach their callbacks
+        # (the flag covers a callback already in flight) so nothing is emitted
+        # into a window that Qt is tearing down
+        self._closing = True
+        self.controller.set_frame_callback(None)
+        self.controller.set_cv_callback(None)
+        self.controller.set_visual_callback(None)
+        self.controller.set_param_callback(None)
+
         if self.cv_meter_window:
             self.cv_meter_window.close()
         if hasattr(self, 'midi_learn'):
             self.midi_learn.shutdown()
+        if self._stop_thread is None:
+            self._stop_thread = threading.Thread(target=self.controller.stop, name="vav-stop", daemon=False)
+            self._stop_thread.start()
+            # Let the shutdown finish before the event loop returns
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self._join_stop_thread)
         event.accept()
 
+    def _join_stop_thread(self):
+        """Wait for the controller.stop() worker started in closeEvent"""
+        if self._stop_thread is not None:
+            self._stop_thread.join()
+
 
 def main():
     """Main entry point"""
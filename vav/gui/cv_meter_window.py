@@ -2,12 +2,17 @@
 獨立的 CV Meters 視窗
 """
 
+from functools import partial
+
 import numpy as np
 from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QMenu, QSlider, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
 from .meter_widget import MeterWidget
 from .visual_preview_widget import VisualPreviewWidget
 
+# Range slider value labels (1-120%), indexed by slider value
+_RANGE_LABELS = tuple(f"{v}%" for v in range(121))
+
 
 class CVMeterWindow(QMainWindow):
     """獨立可調整大小的 CV Meters 視窗"""
@@ -31,7 +36,7 @@ class CVMeterWindow(QMainWindow):
         # Meter widget (6 channels: ENV1-4, SEQ1-2)
         self.meter_widget = MeterWidget(num_channels=6)
         self.meter_widget.setMinimumHeight(180)
-        self.meter_widget.mute_changed.connect(self._on_mute_changed)
+        self.meter_widget.mute_changed.connect(self._on_mute_changed, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self.meter_widget, stretch=1)
 
         # Bottom row: Range slider + Visual Preview
@@ -51,7 +56,7 @@ class CVMeterWindow(QMainWindow):
         self.range_slider.setMaximum(120)
         self.range_slider.setValue(50)
         self.range_slider.setFixedHeight(200)
-        self.range_slider.valueChanged.connect(self._on_range_changed)
+        self.range_slider.valueChanged.connect(self._on_range_changed, Qt.ConnectionType.DirectConnection)
         range_container.addWidget(self.range_slider)
 
         self.range_value_label = QLabel("50%")
@@ -84,11 +89,12 @@ class CVMeterWindow(QMainWindow):
             if self.controller and self.controller.contour_cv_generator:
                 self.controller.contour_cv_generator.set_anchor_position(x_pct, y_pct)
 
-        self.visual_preview.position_changed.connect(on_position_changed)
+        self.visual_preview.position_changed.connect(on_position_changed, Qt.ConnectionType.DirectConnection)
 
     def _on_range_changed(self, value: int):
         """Range slider changed"""
-        self.range_value_label.setText(f"{value}%")
+        if self.range_value_label.text() != _RANGE_LABELS[value]:
+            self.range_value_label.setText(_RANGE_LABELS[value])
         self.visual_preview.set_range(float(value))
 
         # Update controller
@@ -124,31 +130,29 @@ class CVMeterWindow(QMainWindow):
             self.visual_preview.set_position(self.visual_preview.x_pct, inverted_y, emit_signal=True)
 
     def _setup_midi_context_menu(self):
-        """Add context menu for Visual Preview MIDI Learn"""
-        def show_xy_context_menu(pos):
-            menu = QMenu()
-            learn_x_action = menu.addAction("MIDI Learn X")
-            learn_y_action = menu.addAction("MIDI Learn Y")
-            menu.addSeparator()
-            clear_x_action = menu.addAction("Clear X Mapping")
-            clear_y_action = menu.addAction("Clear Y Mapping")
-            menu.addSeparator()
-            clear_all_action = menu.addAction("Clear All MIDI Mappings")
-
-            action = menu.exec(self.visual_preview.mapToGlobal(pos))
-
-            if action == learn_x_action:
-                self.midi_learn.enter_learn_mode("anchor_x")
-            elif action == learn_y_action:
-                self.midi_learn.enter_learn_mode("anchor_y")
-            elif action == clear_x_action:
-                self.midi_learn.clear_mapping("anchor_x")
-            elif action == clear_y_action:
-                self.midi_learn.clear_mapping("anchor_y")
-            elif action == clear_all_action:
-                self.midi_learn.clear_all_mappings()
-
-        self.visual_preview.customContextMenuRequested.connect(show_xy_context_menu)
+        """Add context menu for Visual Preview MIDI Learn (built once, reused per right-click)"""
+        menu = QMenu(self)
+        self._xy_menu_actions = {
+            menu.addAction("MIDI Learn X"): partial(self.midi_learn.enter_learn_mode, "anchor_x"),
+            menu.addAction("MIDI Learn Y"): partial(self.midi_learn.enter_learn_mode, "anchor_y"),
+        }
+        menu.addSeparator()
+        self._xy_menu_actions[menu.addAction("Clear X Mapping")] = partial(self.midi_learn.clear_mapping, "anchor_x")
+        self._xy_menu_actions[menu.addAction("Clear Y Mapping")] = partial(self.midi_learn.clear_mapping, "anchor_y")
+        menu.addSeparator()
+        self._xy_menu_actions[menu.addAction("Clear All MIDI Mappings")] = self.midi_learn.clear_all_mappings
+        self._xy_menu = menu
+
+        self.visual_preview.customContextMenuRequested.connect(
+            self._show_xy_context_menu, Qt.ConnectionType.DirectConnection
+        )
+
+    def _show_xy_context_menu(self, pos):
+        """Show the Visual Preview MIDI Learn menu and run the chosen action"""
+        action = self._xy_menu.exec(self.visual_preview.mapToGlobal(pos))
+        handler = self._xy_menu_actions.get(action)
+        if handler is not None:
+            handler()
 
     def update_values(self, samples: np.ndarray):
         """更新 CV 值"""
@@ -5,7 +5,7 @@ Vertical meter widget for CV signals (極簡風格)
 import numpy as np
 from PyQt6.QtWidgets import QWidget, QSizePolicy
 from PyQt6.QtCore import Qt, QRectF, QRect, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QPixmapCache
 from ..utils.cv_colors import SCOPE_COLORS
 
 
@@ -50,6 +50,10 @@ class MeterWidget(QWidget):
         # Mute button rectangles for click detection
         self.mute_button_rects = []
 
+        # Static layer (buttons, labels, meter backgrounds), see _static_layer
+        self._static_pixmap = None
+        self._static_key = None
+
         # Styling
         self.setStyleSheet("background-color: #000000;")
 
@@ -99,11 +103,45 @@ class MeterWidget(QWidget):
             self.muted[channel] = muted
             self.update()
 
-    def paintEvent(self, event):
-        """Paint the meters (horizontal layout)"""
-        painter = QPainter(self)
+    def _mute_button_pixmap(self, muted: bool, size: int) -> QPixmap:
+        """Return the mute button pixmap, rendered once and shared via QPixmapCache"""
+        dpr = self.devicePixelRatioF()
+        key = f"vav_meter_mute_{int(muted)}_{size}_{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        # 1px margin on each side for the antialiased outline
+        extent = size + 2
+        pixmap = QPixmap(int(extent * dpr), int(extent * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        painter.translate(1, 1)
+
+        # Button background
+        if muted:
+            painter.setBrush(QColor(180, 60, 60))  # Red when muted
+            painter.setPen(QPen(QColor(200, 80, 80), 1))
+        else:
+            painter.setBrush(QColor(60, 60, 60))  # Gray when active
+            painter.setPen(QPen(QColor(100, 100, 100), 1))
+
+        painter.drawRect(0, 0, size, size)
+
+        # Draw M text
+        painter.setPen(QPen(QColor(220, 220, 220), 1))
+        painter.drawText(0, 0, size, size, Qt.AlignmentFlag.AlignCenter, "M")
+        painter.end()
 
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _meter_geometry(self):
+        """Meter layout for the current widget size (horizontal layout)"""
         width = self.width()
         height = self.height()
 
@@ -120,36 +158,42 @@ class MeterWidget(QWidget):
         meter_height = 15  # 固定高度
 
         start_y = (height - meter_height * self.num_channels - meter_spacing * (self.num_channels - 1)) // 2
+        button_x = 2
+        meter_x = button_x + mute_button_size + mute_button_margin + label_width
+        rows = [start_y + i * (meter_height + meter_spacing) for i in range(self.num_channels)]
+        return (mute_button_size, mute_button_margin, label_width, button_x,
+                meter_x, meter_width, meter_height, rows)
+
+    def _static_layer(self) -> QPixmap:
+        """Mute buttons, labels and meter backgrounds, re-rendered only on resize/mute change"""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, self.muted.tobytes())
+        if self._static_key == key:
+            return self._static_pixmap
+
+        (mute_button_size, mute_button_margin, label_width, button_x,
+         meter_x, meter_width, meter_height, rows) = self._meter_geometry()
+
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
 
-        # Clear button rects
+        # Button rects for click detection
         self.mute_button_rects = []
 
-        for i in range(self.num_channels):
-            y = start_y + i * (meter_height + meter_spacing)
-
+        for i, y in enumerate(rows):
             # Draw mute button (left side)
-            button_x = 2
             button_y = y + (meter_height - mute_button_size) // 2
-            button_rect = QRect(button_x, button_y, mute_button_size, mute_button_size)
-            self.mute_button_rects.append(button_rect)
-
-            # Button background
-            if self.muted[i]:
-                painter.setBrush(QColor(180, 60, 60))  # Red when muted
-                painter.setPen(QPen(QColor(200, 80, 80), 1))
-            else:
-                painter.setBrush(QColor(60, 60, 60))  # Gray when active
-                painter.setPen(QPen(QColor(100, 100, 100), 1))
-
-            painter.drawRect(button_x, button_y, mute_button_size, mute_button_size)
+            self.mute_button_rects.append(QRect(button_x, button_y, mute_button_size, mute_button_size))
 
-            # Draw M text
-            painter.setPen(QPen(QColor(220, 220, 220), 1))
-            painter.drawText(
-                button_x, button_y,
-                mute_button_size, mute_button_size,
-                Qt.AlignmentFlag.AlignCenter,
-                "M"
+            # Button (cached pixmap, offset by its 1px outline margin)
+            painter.drawPixmap(
+                button_x - 1, button_y - 1,
+                self._mute_button_pixmap(bool(self.muted[i]), mute_button_size)
             )
 
             # Draw label (after mute button)
@@ -162,14 +206,26 @@ class MeterWidget(QWidget):
                 self.labels[i]
             )
 
-            # Meter starts after label
-            meter_x = label_x + label_width
-
             # Draw background (dark gray)
             painter.setPen(QPen(QColor(60, 60, 60), 1))
             painter.setBrush(QColor(20, 20, 20))
             painter.drawRect(meter_x, y, meter_width, meter_height)
 
+        painter.end()
+
+        self._static_pixmap = pixmap
+        self._static_key = key
+        return pixmap
+
+    def paintEvent(self, event):
+        """Paint the meters: blit the static layer, then draw the moving bars on top"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._static_layer())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        (_, _, _, _, meter_x, meter_width, meter_height, rows) = self._meter_geometry()
+
+        for i, y in enumerate(rows):
             # Draw meter bar (horizontal fill from left)
             bar_width = int(self.values[i] * meter_width)
             if bar_width > 0:
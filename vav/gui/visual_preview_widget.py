@@ -19,7 +19,7 @@ class VisualPreviewWidget(QWidget):
         self.setFixedSize(546, 230)  # Reduced height for better layout balance
         self.setStyleSheet("background-color: #000000; border: 1px solid #404040;")
 
-        # Current frame (RGB numpy array or None)
+        # Current frame (BGR numpy array or None)
         self.frame = None
 
         # Anchor position and range
@@ -37,7 +37,7 @@ class VisualPreviewWidget(QWidget):
         Update preview with new frame
 
         Args:
-            frame: RGB image as numpy array (H, W, 3) uint8
+            frame: BGR image as numpy array (H, W, 3) uint8
         """
         self.frame = frame
         self.update()
@@ -85,16 +85,15 @@ class VisualPreviewWidget(QWidget):
         # Draw frame if available
         if self.frame is not None:
             # Convert numpy array to QImage
-            height, width, channels = self.frame.shape
-            bytes_per_line = channels * width
+            height, width = self.frame.shape[:2]
 
             qimage = QImage(
                 self.frame.data,
                 width,
                 height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            ).rgbSwapped()  # Swap RGB to BGR for Qt
+                self.frame.strides[0],
+                QImage.Format.Format_BGR888  # Frame is BGR, Qt swaps during blit
+            )
 
             # Scale to fit widget size while maintaining aspect ratio
             pixmap = QPixmap.fromImage(qimage)
@@ -8,6 +8,7 @@ from typing import Optional, Tuple, List, Dict
 import subprocess
 import json
 import threading
+from functools import lru_cache
 
 
 class AsyncCamera:
@@ -20,6 +21,7 @@ class AsyncCamera:
         self.fps = fps
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_opened = False
+        self.resolution: Tuple[int, int] = (0, 0)  # Actual size, read once at open
 
         # Async reading
         self.frame = None
@@ -36,6 +38,10 @@ class AsyncCamera:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self.resolution = (
+            int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
 
         self.is_opened = True
 
@@ -74,14 +80,11 @@ class AsyncCamera:
         if self.cap is not None:
             self.cap.release()
             self.is_opened = False
+            self.resolution = (0, 0)
 
     def get_resolution(self) -> Tuple[int, int]:
-        """Get actual camera resolution"""
-        if self.cap is None:
-            return (0, 0)
-        w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        return (w, h)
+        """Get actual camera resolution (cached at open, (0, 0) when closed)"""
+        return self.resolution
 
     def __del__(self):
         self.close()
@@ -206,6 +209,7 @@ class Camera:
         self.fps = fps
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_opened = False
+        self.resolution: Tuple[int, int] = (0, 0)  # Actual size, read once at open
 
     def open(self) -> bool:
         """Open camera device"""
@@ -216,6 +220,10 @@ class Camera:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self.resolution = (
+            int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
 
         self.is_opened = True
         return True
@@ -233,14 +241,11 @@ class Camera:
         if self.cap is not None:
             self.cap.release()
             self.is_opened = False
+            self.resolution = (0, 0)
 
     def get_resolution(self) -> Tuple[int, int]:
-        """Get actual camera resolution"""
-        if self.cap is None:
-            return (0, 0)
-        w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        return (w, h)
+        """Get actual camera resolution (cached at open, (0, 0) when closed)"""
+        return self.resolution
 
     def __del__(self):
         self.close()
@@ -286,8 +291,13 @@ def get_camera_list() -> List[Dict]:
     return cameras
 
 
+@lru_cache(maxsize=16)
 def get_camera_name(device_id: int) -> str:
-    """Get camera name for a given device ID"""
+    """Get camera name for a given device ID
+
+    Cached (enumeration shells out on macOS); call get_camera_name.cache_clear()
+    when the device set may have changed
+    """
     cameras = get_camera_list()
     for cam in cameras:
         if cam['index'] == device_id: